@@ -138,7 +138,8 @@ def find_include_markers(script_content: str) -> List[Tuple[str, str]]:
         script_content: The content of the script to scan
 
     Returns:
-        List of tuples (marker, module_path) for each include found
+        List of tuples (marker, module_path) for each include found. A module
+        that is referenced more than once is only listed the first time.
 
     Example:
         >>> content = "# {{include utils.py}}\\n# {{include lib/core.py}}"
@@ -153,10 +154,15 @@ def find_include_markers(script_content: str) -> List[Tuple[str, str]]:
         markers.append((MARKER, UTILS_FILE))
 
     # Find modular lib includes using regex
+    seen_modules = {module_path for _, module_path in markers}
     lib_matches = re.finditer(MODULE_MARKER_PATTERN, script_content)
     for match in lib_matches:
         full_marker = match.group(0)
         module_path = match.group(1)
+        if module_path in seen_modules:
+            logging.warning(f"Duplicate include of {module_path} ignored")
+            continue
+        seen_modules.add(module_path)
         markers.append((full_marker, module_path))
 
     return markers
@@ -206,8 +212,11 @@ def process_multiple_includes(script_content: str) -> str:
 # ======================================================
 """
 
-            # Replace the marker with the injected content
-            processed_content = processed_content.replace(marker, injected_content)
+            # Replace the first marker with the injected content and drop any
+            # repeats, so module-level state (caches, locks) exists only once
+            processed_content = processed_content.replace(
+                marker, injected_content, 1
+            ).replace(marker, "")
 
         except Exception as e:
             # Re-raise with context about which module failed
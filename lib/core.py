@@ -15,14 +15,18 @@ in built tools while maintaining the self-contained principle.
 
 import argparse
 import contextlib
+import errno
 import os
 import platform
+import re
 import sys
 import tempfile
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
 
 # Platform-specific imports
 try:
@@ -35,11 +39,41 @@ try:
 except ImportError:
     msvcrt = None  # Unix/Linux/macOS
 
+# Values treated as boolean true in environment variables and .env files
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
 
+# Global .env file shared by all tools, resolved once at import
+_GLOBAL_ENV_PATH = str(Path.home() / ".media-library-tools" / ".env")
+
+# Directory holding FileLock lock files, resolved once at import
+_LOCK_DIR = tempfile.gettempdir()
+
+# Open lock files read/write, creating them on first use
+_LOCK_OPEN_FLAGS = os.O_CREAT | os.O_RDWR
+
+# Errors from a non-blocking lock attempt that mean another process holds the
+# lock; msvcrt.locking reports a held lock as EACCES
+_LOCK_CONTENTION_ERRNOS = frozenset(
+    (errno.EAGAIN, errno.EWOULDBLOCK) + ((errno.EACCES,) if msvcrt is not None else ())
+)
+
+# Environment variables that mark a run as non-interactive (cron, CI, etc.)
+_NON_INTERACTIVE_VARS = ("CRON", "CI", "AUTOMATED", "NON_INTERACTIVE")
+
+# KEY=value lines in .env files; comment lines and lines without '=' never match
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
+
+@lru_cache(maxsize=1)
 def is_non_interactive() -> bool:
     """
     Detect if running in non-interactive environment (cron, etc.).
 
+    The result is cached for the lifetime of the process; call
+    _reset_platform_cache() to force re-detection.
+
     Returns:
         True if non-interactive, False otherwise
     """
@@ -48,16 +82,21 @@ def is_non_interactive() -> bool:
         return True
 
     # Check for common non-interactive environment variables
-    non_interactive_vars = ["CRON", "CI", "AUTOMATED", "NON_INTERACTIVE"]
-    for var in non_interactive_vars:
-        if os.environ.get(var):
-            return True
+    env = os.environ
+    if any(env.get(var) for var in _NON_INTERACTIVE_VARS):
+        return True
 
     # Check if TERM is not set or is 'dumb' (common in automated environments)
-    term = os.environ.get("TERM", "")
+    term = env.get("TERM", "")
     return bool(not term or term == "dumb")
 
 
+def _refresh_global_env_path() -> None:
+    """Re-resolve the global .env path, e.g. after HOME changes (used by tests)."""
+    global _GLOBAL_ENV_PATH
+    _GLOBAL_ENV_PATH = str(Path.home() / ".media-library-tools" / ".env")
+
+
 def read_global_config_bool(var_name: str, default: bool = False) -> bool:
     """
     Read a boolean environment variable with support for .env files.
@@ -75,43 +114,30 @@ def read_global_config_bool(var_name: str, default: bool = False) -> bool:
     # Check environment variable directly
     value = os.environ.get(var_name)
     if value is not None:
-        return value.lower() in ("true", "1", "yes", "on")
+        return value.strip().lower() in _TRUTHY
 
-    # Check local .env file
-    env_file = ".env"
-    if os.path.exists(env_file):
-        try:
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith(f"{var_name}="):
-                        value = line.split("=", 1)[1].strip()
-                        return value.lower() in ("true", "1", "yes", "on")
-        except OSError:
-            pass
-
-    # Check global .env file
-    global_env_path = Path.home() / ".media-library-tools" / ".env"
-    if global_env_path.exists():
-        try:
-            with open(global_env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith(f"{var_name}="):
-                        value = line.split("=", 1)[1].strip()
-                        return value.lower() in ("true", "1", "yes", "on")
-        except OSError:
-            pass
+    # Check local .env file, then global .env file (parsed once, served from cache)
+    for env_path in (".env", _GLOBAL_ENV_PATH):
+        env_values = _config_cache.get_env_file(env_path)
+        if env_values and var_name in env_values:
+            return env_values[var_name].strip().lower() in _TRUTHY
 
     return default
 
 
+# Cached .env entry: (read-only contents, stat fingerprint, load time)
+_EnvCacheEntry = Tuple[Mapping[str, str], Tuple[int, int, int], float]
+
+
 class ConfigCache:
     """
-    Thread-safe configuration cache with TTL support.
+    Thread-safe configuration cache with stat-based invalidation.
 
     Caches configuration values from .env files to avoid repeated file system
-    operations. Uses threading locks for thread safety.
+    operations. Cached entries are reused while the file's stat fingerprint
+    (modification time, size and inode) is unchanged, so edits are picked up
+    immediately. Cache hits are lock-free: writers hold a lock and publish a
+    new snapshot dict, which readers pick up with a single attribute load.
     """
 
     def __init__(self, ttl_seconds: int = 300):
@@ -119,37 +145,76 @@ class ConfigCache:
         Initialize configuration cache.
 
         Args:
-            ttl_seconds: Time-to-live for cached values in seconds (default: 300 = 5 minutes)
+            ttl_seconds: Maximum age of a cached entry in seconds, as a safety
+                bound for filesystems with coarse timestamps (default: 300 = 5 minutes)
         """
-        self._cache: Dict[str, Dict[str, str]] = {}
-        self._cache_times: Dict[str, float] = {}
+        self._cache: Dict[str, _EnvCacheEntry] = {}
         self._lock = threading.Lock()
         self._ttl = ttl_seconds
 
-    def get_env_file(self, file_path: str) -> Optional[Dict[str, str]]:
+    def get_env_file(self, file_path: str) -> Optional[Mapping[str, str]]:
         """
         Get cached .env file contents or read from disk.
 
+        The cached dictionary is returned as a read-only view rather than a copy.
+
         Args:
             file_path: Path to .env file
 
         Returns:
-            Dictionary of key-value pairs from .env file, or None if file doesn't exist
+            Read-only mapping of key-value pairs from .env file, or None if file
+            doesn't exist
         """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        fingerprint = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        # Fast path: reuse the cached parse while the file is unchanged
+        entry = self._cache.get(file_path)
+        if self._is_fresh(entry, fingerprint):
+            return entry[0] or None
+
         with self._lock:
-            # Check if cached and not expired
-            if file_path in self._cache:
-                cache_time = self._cache_times.get(file_path, 0)
-                if time.time() - cache_time < self._ttl:
-                    return self._cache[file_path].copy()
+            # Another thread may have refreshed the entry while we waited
+            entry = self._cache.get(file_path)
+            if self._is_fresh(entry, fingerprint):
+                return entry[0] or None
 
             # Read from disk
             env_dict = self._read_env_file(file_path)
-            if env_dict is not None:
-                self._cache[file_path] = env_dict
-                self._cache_times[file_path] = time.time()
+            if env_dict is None:
+                return None
+
+            # Copy-on-write so lock-free readers never see a dict being mutated
+            env_view = MappingProxyType(env_dict)
+            snapshot = dict(self._cache)
+            snapshot[file_path] = (env_view, fingerprint, time.time())
+            self._cache = snapshot
+
+            return env_view or None
+
+    def _is_fresh(
+        self,
+        entry: Optional[_EnvCacheEntry],
+        fingerprint: Tuple[int, int, int],
+    ) -> bool:
+        """
+        Check whether a cache entry still matches the file on disk.
 
-            return env_dict.copy() if env_dict else None
+        Args:
+            entry: Cached entry for the file, or None
+            fingerprint: Current (mtime_ns, size, inode) of the file
+
+        Returns:
+            True if the entry can be reused, False otherwise
+        """
+        return (
+            entry is not None
+            and entry[1] == fingerprint
+            and time.time() - entry[2] < self._ttl
+        )
 
     def _read_env_file(self, file_path: str) -> Optional[Dict[str, str]]:
         """
@@ -161,46 +226,39 @@ class ConfigCache:
         Returns:
             Dictionary of key-value pairs, or None if file doesn't exist
         """
-        if not os.path.exists(file_path):
-            return None
-
-        env_dict = {}
+        # Open directly rather than checking existence first: one syscall,
+        # and no race if the file is replaced in between
         try:
             with open(file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    # Parse key=value pairs
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        # Remove quotes from values
-                        if value and value[0] in ('"', "'") and value[-1] == value[0]:
-                            value = value[1:-1]
-                        env_dict[key] = value
+                content = f.read()
         except OSError:
             return None
 
+        env_dict = dict(_ENV_LINE_RE.findall(content))
+        # Remove quotes from values
+        for key, value in env_dict.items():
+            if value and value[0] in ('"', "'") and value[-1] == value[0]:
+                env_dict[key] = value[1:-1]
+
         return env_dict
 
     def clear_cache(self) -> None:
         """Clear all cached configuration values."""
         with self._lock:
-            self._cache.clear()
-            self._cache_times.clear()
+            self._cache = {}
 
 
 # Global cache instance
 _config_cache = ConfigCache()
 
+# Shared read-only result for missing or empty .env files
+_EMPTY_ENV: Mapping[str, str] = MappingProxyType({})
+
 
 def read_local_env_file(
     env_path: Optional[str] = None,
     use_cache: bool = True
-) -> Dict[str, str]:
+) -> Mapping[str, str]:
     """
     Read local .env file with optional caching.
 
@@ -209,18 +267,59 @@ def read_local_env_file(
         use_cache: Whether to use cache (default: True)
 
     Returns:
-        Dictionary of key-value pairs from .env file
+        Mapping of key-value pairs from .env file (read-only when cached)
     """
     if env_path is None:
         env_path = ".env"
 
     if use_cache:
         result = _config_cache.get_env_file(env_path)
-        return result if result is not None else {}
     else:
         # Direct read without cache
         result = _config_cache._read_env_file(env_path)
-        return result if result is not None else {}
+    return result if result is not None else _EMPTY_ENV
+
+
+# Sentinel distinguishing a missing CLI attribute from one set to None
+_MISSING = object()
+
+
+def _get_cli_value(cli_args: Optional[argparse.Namespace], key: str) -> Any:
+    """
+    Look up a configuration key on parsed CLI arguments.
+
+    The lowercase attribute name (argparse's default dest) is preferred; the
+    exact key is only tried when no lowercase attribute exists.
+
+    Args:
+        cli_args: Parsed CLI arguments namespace, or None
+        key: Configuration key to look up
+
+    Returns:
+        The CLI value, or None if not provided
+    """
+    if cli_args is None:
+        return None
+    value = getattr(cli_args, key.lower(), _MISSING)
+    if value is _MISSING:
+        value = getattr(cli_args, key, None)
+    return value
+
+
+def _iter_env_file_sources(
+    local_env_path: Optional[str] = None
+) -> Iterator[Tuple[str, Mapping[str, str]]]:
+    """
+    Yield .env file sources in priority order, loading each only when reached.
+
+    Args:
+        local_env_path: Path to local .env file (defaults to current directory)
+
+    Yields:
+        Tuples of (source name, key-value mapping): 'local_env' then 'global_env'
+    """
+    yield 'local_env', read_local_env_file(local_env_path)
+    yield 'global_env', read_local_env_file(_GLOBAL_ENV_PATH)
 
 
 def read_config_value(
@@ -259,13 +358,9 @@ def read_config_value(
     raw_value = None
 
     # 1. Check CLI arguments (highest priority)
-    if cli_args is not None:
-        # Try both exact key and lowercase version
-        cli_attr = key.lower() if hasattr(cli_args, key.lower()) else key
-        if hasattr(cli_args, cli_attr):
-            cli_value = getattr(cli_args, cli_attr)
-            if cli_value is not None:
-                raw_value = str(cli_value)
+    cli_value = _get_cli_value(cli_args, key)
+    if cli_value is not None:
+        raw_value = str(cli_value)
 
     # 2. Check environment variable
     if raw_value is None:
@@ -273,18 +368,12 @@ def read_config_value(
         if env_value is not None:
             raw_value = env_value
 
-    # 3. Check local .env file
+    # 3-4. Check local .env file, then global .env file
     if raw_value is None:
-        local_env = read_local_env_file(local_env_path)
-        if key in local_env:
-            raw_value = local_env[key]
-
-    # 4. Check global .env file
-    if raw_value is None:
-        global_env_path = str(Path.home() / ".media-library-tools" / ".env")
-        global_env = read_local_env_file(global_env_path)
-        if key in global_env:
-            raw_value = global_env[key]
+        for _source, env_values in _iter_env_file_sources(local_env_path):
+            if key in env_values:
+                raw_value = env_values[key]
+                break
 
     # Use default if not found anywhere
     if raw_value is None:
@@ -292,7 +381,7 @@ def read_config_value(
 
     # Type conversion
     if value_type == 'bool':
-        return raw_value.lower() in ('true', '1', 'yes', 'on')
+        return raw_value.strip().lower() in _TRUTHY
     elif value_type == 'int':
         try:
             return int(raw_value)
@@ -357,27 +446,17 @@ def get_config_source(
         Source name: 'cli', 'env', 'local_env', 'global_env', or 'not_found'
     """
     # Check CLI arguments
-    if cli_args is not None:
-        cli_attr = key.lower() if hasattr(cli_args, key.lower()) else key
-        if hasattr(cli_args, cli_attr):
-            cli_value = getattr(cli_args, cli_attr)
-            if cli_value is not None:
-                return 'cli'
+    if _get_cli_value(cli_args, key) is not None:
+        return 'cli'
 
     # Check environment variable
     if os.environ.get(key) is not None:
         return 'env'
 
-    # Check local .env
-    local_env = read_local_env_file(local_env_path)
-    if key in local_env:
-        return 'local_env'
-
-    # Check global .env
-    global_env_path = str(Path.home() / ".media-library-tools" / ".env")
-    global_env = read_local_env_file(global_env_path)
-    if key in global_env:
-        return 'global_env'
+    # Check local .env, then global .env
+    for source, env_values in _iter_env_file_sources(local_env_path):
+        if key in env_values:
+            return source
 
     return 'not_found'
 
@@ -399,61 +478,41 @@ def debug_config_resolution(
         local_env_path: Path to local .env file
         show_value: Whether to show actual value (default: False for security)
     """
-    print(f"\nConfiguration Debug: {key}")
-    print("=" * 60)
-
-    # Check each source
+    # Check each source, collecting (label, value) pairs in priority order
     sources_found = []
 
     # CLI
-    if cli_args is not None:
-        cli_attr = key.lower() if hasattr(cli_args, key.lower()) else key
-        if hasattr(cli_args, cli_attr):
-            cli_value = getattr(cli_args, cli_attr)
-            if cli_value is not None:
-                sources_found.append('CLI')
-                if show_value:
-                    print(f"  CLI: {cli_value}")
-                else:
-                    print(f"  CLI: <set>")
+    cli_value = _get_cli_value(cli_args, key)
+    if cli_value is not None:
+        sources_found.append(('CLI', cli_value))
 
     # ENV
     env_value = os.environ.get(key)
     if env_value is not None:
-        sources_found.append('ENV')
-        if show_value:
-            print(f"  ENV: {env_value}")
-        else:
-            print(f"  ENV: <set>")
-
-    # Local .env
-    local_env = read_local_env_file(local_env_path)
-    if key in local_env:
-        sources_found.append('Local .env')
-        if show_value:
-            print(f"  Local .env: {local_env[key]}")
-        else:
-            print(f"  Local .env: <set>")
-
-    # Global .env
-    global_env_path = str(Path.home() / ".media-library-tools" / ".env")
-    global_env = read_local_env_file(global_env_path)
-    if key in global_env:
-        sources_found.append('Global .env')
-        if show_value:
-            print(f"  Global .env: {global_env[key]}")
-        else:
-            print(f"  Global .env: <set>")
+        sources_found.append(('ENV', env_value))
+
+    # Local .env, then global .env
+    for source, env_values in _iter_env_file_sources(local_env_path):
+        if key in env_values:
+            label = 'Local .env' if source == 'local_env' else 'Global .env'
+            sources_found.append((label, env_values[key]))
+
+    # Build the report and write it in a single call
+    lines = [f"\nConfiguration Debug: {key}", "=" * 60]
+    for label, value in sources_found:
+        lines.append(f"  {label}: {value if show_value else '<set>'}")
 
     # Show resolution
-    print(f"\nResolution:")
+    lines.append("\nResolution:")
     if sources_found:
-        print(f"  Found in: {', '.join(sources_found)}")
-        print(f"  Using: {sources_found[0]} (highest priority)")
+        labels = [label for label, _value in sources_found]
+        lines.append(f"  Found in: {', '.join(labels)}")
+        lines.append(f"  Using: {labels[0]} (highest priority)")
     else:
-        print(f"  Not found in any source")
+        lines.append("  Not found in any source")
 
-    print("=" * 60)
+    lines.append("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def validate_config_setup() -> Dict[str, Any]:
@@ -481,28 +540,26 @@ def validate_config_setup() -> Dict[str, Any]:
         results['info'].append(f"Local .env file found: {os.path.abspath(local_env_path)}")
 
         # Check readability
-        try:
-            with open(local_env_path, 'r') as f:
-                f.read()
-        except OSError as e:
-            results['warnings'].append(f"Local .env exists but cannot be read: {e}")
+        if not os.access(local_env_path, os.R_OK):
+            results['warnings'].append(
+                f"Local .env exists but cannot be read: {os.path.abspath(local_env_path)}"
+            )
             results['valid'] = False
     else:
         results['files']['local_env'] = 'not_found'
         results['info'].append("No local .env file found")
 
     # Check global .env
-    global_env_path = Path.home() / ".media-library-tools" / ".env"
-    if global_env_path.exists():
+    global_env_path = _GLOBAL_ENV_PATH
+    if os.path.exists(global_env_path):
         results['files']['global_env'] = 'exists'
         results['info'].append(f"Global .env file found: {global_env_path}")
 
         # Check readability
-        try:
-            with open(global_env_path, 'r') as f:
-                f.read()
-        except OSError as e:
-            results['warnings'].append(f"Global .env exists but cannot be read: {e}")
+        if not os.access(global_env_path, os.R_OK):
+            results['warnings'].append(
+                f"Global .env exists but cannot be read: {global_env_path}"
+            )
             results['valid'] = False
     else:
         results['files']['global_env'] = 'not_found'
@@ -511,7 +568,7 @@ def validate_config_setup() -> Dict[str, Any]:
     # Check for conflicts (same key in multiple places with different values)
     if results['files']['local_env'] == 'exists' and results['files']['global_env'] == 'exists':
         local_env = read_local_env_file(local_env_path)
-        global_env = read_local_env_file(str(global_env_path))
+        global_env = read_local_env_file(global_env_path)
 
         # Find keys that exist in both
         common_keys = set(local_env.keys()) & set(global_env.keys())
@@ -522,6 +579,7 @@ def validate_config_setup() -> Dict[str, Any]:
     return results
 
 
+@lru_cache(maxsize=1)
 def is_windows() -> bool:
     """
     Detect if running on Windows platform.
@@ -532,10 +590,21 @@ def is_windows() -> bool:
     return platform.system().lower() == "windows"
 
 
+def _reset_platform_cache() -> None:
+    """Clear cached platform and environment detection results (used by tests)."""
+    is_non_interactive.cache_clear()
+    is_windows.cache_clear()
+    should_use_emojis.cache_clear()
+
+
+@lru_cache(maxsize=1)
 def should_use_emojis() -> bool:
     """
     Determine if emojis should be used based on platform and environment.
 
+    Checks run cheapest-first and the result is cached for the lifetime of
+    the process; call _reset_platform_cache() to force re-detection.
+
     Returns:
         True if emojis should be used, False otherwise
     """
@@ -547,13 +616,18 @@ def should_use_emojis() -> bool:
     if is_non_interactive():
         return False
 
-    # Check for explicit emoji suppression
+    # Explicit emoji suppression: the environment is consulted first, and
+    # .env files are only read when NO_EMOJIS is not set there
     return not read_global_config_bool("NO_EMOJIS", False)
 
 
 class FileLock:
     """
     File locking utility class for preventing concurrent executions.
+
+    All instances sharing a lock prefix contend for the same lock file in the
+    system temp directory. The file is left in place on release so the next
+    run reuses it; only the OS-level lock marks ownership.
     """
 
     def __init__(self, lock_prefix: str = "media_library_tool"):
@@ -564,12 +638,17 @@ class FileLock:
             lock_prefix: Prefix for lock file name
         """
         self.lock_prefix = lock_prefix
-        self.lock_file = None
+        self._lock_path = os.path.join(_LOCK_DIR, f"{lock_prefix}.lock")
+        self._fd: Optional[int] = None
 
     def acquire_lock(self, force: bool = False) -> bool:
         """
         Acquire file lock to prevent multiple instances.
 
+        The lock file is created on first use and intentionally left behind:
+        deleting it on release would let a waiting process lock a file that
+        a newer run has already replaced.
+
         Args:
             force: If True, skip locking mechanism
 
@@ -579,64 +658,62 @@ class FileLock:
         if force:
             return True
 
+        fd = None
+        contended = False
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", prefix=f"{self.lock_prefix}_", suffix=".lock", delete=False
-            ) as temp_file:
-                self.lock_file = temp_file
-                
-                # Platform-specific file locking
+            fd = os.open(self._lock_path, _LOCK_OPEN_FLAGS, 0o644)
+
+            # Platform-specific file locking
+            try:
                 if fcntl is not None:  # Unix/Linux/macOS
-                    fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
                 elif msvcrt is not None:  # Windows
-                    msvcrt.locking(self.lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
                 else:
                     # Fallback: no locking available, just proceed
                     pass
-                    
-                self.lock_file.write(str(os.getpid()))
-                self.lock_file.flush()
+            except OSError as e:
+                contended = e.errno in _LOCK_CONTENTION_ERRNOS
+                raise
+
+            # Record the owner only once the lock is held
+            os.ftruncate(fd, 0)
+            os.write(fd, str(os.getpid()).encode())
+            self._fd = fd
             return True
-        except (OSError, IOError) as e:
-            if self.lock_file:
-                self.lock_file.close()
+        except OSError as e:
+            if fd is not None:
                 with contextlib.suppress(OSError):
-                    os.unlink(self.lock_file.name)
-                self.lock_file = None
-            print(
-                "Error: Another instance is already running. Use --force to override."
-            )
-            print(f"Lock error: {e}")
+                    os.close(fd)
+            if contended:
+                print(
+                    "Error: Another instance is already running. Use --force to override."
+                )
+            else:
+                print(f"Error: Could not lock {self._lock_path}: {e}")
             return False
 
     def release_lock(self) -> None:
         """
         Release the file lock.
         """
-        if self.lock_file:
-            try:
-                # Only unlock if file is still open
-                if not self.lock_file.closed:
-                    # Platform-specific file unlocking
-                    if fcntl is not None:  # Unix/Linux/macOS
-                        fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
-                    elif msvcrt is not None:  # Windows
-                        msvcrt.locking(self.lock_file.fileno(), msvcrt.LK_UNLCK, 1)
-                    # No explicit unlock needed for fallback case
-                    
-                    self.lock_file.close()
-            except (OSError, ValueError, IOError):
-                # Handle both file system errors and closed file errors
-                pass
-
-            # Always try to remove lock file if it exists
-            try:
-                if os.path.exists(self.lock_file.name):
-                    os.unlink(self.lock_file.name)
-            except OSError:
-                pass
-            finally:
-                self.lock_file = None
+        if self._fd is None:
+            return
+
+        try:
+            # Platform-specific file unlocking
+            if fcntl is not None:  # Unix/Linux/macOS
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:  # Windows
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            # No explicit unlock needed for fallback case
+        except OSError:
+            pass
+        finally:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
 
 
 # Legacy standalone functions for backward compatibility
@@ -18,28 +18,96 @@ API keys and other credentials across media library tools.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
+
+# Default .env locations, resolved once at import
+_DEFAULT_GLOBAL_ENV_PATH = Path.home() / '.media-library-tools' / '.env'
+_DEFAULT_LOCAL_ENV_PATH = Path('.env')
+
+
+@lru_cache(maxsize=8)
+def _load_env_file(path_str: str, fingerprint: Tuple[int, int, int]) -> Mapping[str, str]:
+    """
+    Parse a .env file into a read-only mapping, cached per file version.
+
+    The fingerprint (mtime_ns, size, inode) is part of the cache key, so an
+    edited file is parsed again while unchanged files are served from memory.
+    When a key appears more than once, the first occurrence wins.
+
+    Args:
+        path_str: Path to the .env file
+        fingerprint: Stat fingerprint of the file
+
+    Returns:
+        Mapping of key to value with surrounding quotes stripped
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    values = {}
+    with open(path_str, 'r') as f:
+        for line in f.read().splitlines():
+            line = line.strip()
+            # Skip blank lines and comments before splitting
+            if not line or line[0] == '#':
+                continue
+            key, sep, value = line.partition('=')
+            if sep and key:
+                values.setdefault(key, value.strip().strip('"\''))
+    return MappingProxyType(values)
+
+
+def _read_env_values(path: Path) -> Optional[Mapping[str, str]]:
+    """
+    Get the parsed contents of a .env file, using the parse cache.
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        Mapping of key to value, or None if the file does not exist
+
+    Raises:
+        OSError: If the file exists but cannot be read
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _load_env_file(str(path), (st.st_mtime_ns, st.st_size, st.st_ino))
 
 
 class CredentialManager:
     """Manager for resolving credentials from multiple sources with priority order."""
 
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, global_env_path: Optional[Path] = None,
+                 local_env_path: Optional[Path] = None):
         """
         Initialize credential manager.
 
         Args:
             debug: Enable debug output for credential source tracking
+            global_env_path: Override for the global .env file
+                             (default: ~/.media-library-tools/.env)
+            local_env_path: Override for the local .env file (default: ./.env)
         """
         self.debug = debug
-        self.global_env_path = Path.home() / '.media-library-tools' / '.env'
-        self.local_env_path = Path('.env')
+        self.global_env_path = Path(global_env_path) if global_env_path else _DEFAULT_GLOBAL_ENV_PATH
+        self.local_env_path = Path(local_env_path) if local_env_path else _DEFAULT_LOCAL_ENV_PATH
+
+    def _log_debug(self, message: str, *args) -> None:
+        """
+        Log debug message if debug mode is enabled.
 
-    def _log_debug(self, message: str) -> None:
-        """Log debug message if debug mode is enabled."""
+        Args:
+            message: %-style format string
+            *args: Values for the format string, only formatted when debugging
+        """
         if self.debug:
-            print(f"DEBUG: {message}")
+            print("DEBUG: " + (message % args if args else message))
 
     def get_credential(self, credential_name: str, cli_value: Optional[str] = None) -> Optional[str]:
         """
@@ -64,44 +132,61 @@ class CredentialManager:
             >>> if not api_key:
             ...     print("Error: TVDB_API_KEY not found")
         """
+        return self._lookup_credential(credential_name, cli_value)
+
+    def _lookup_credential(self, credential_name: str, cli_value: Optional[str] = None,
+                           env_files: Optional[List[Tuple[str, Mapping[str, str]]]] = None
+                           ) -> Optional[str]:
+        """
+        Resolve a credential, optionally reusing .env files loaded by the caller.
+
+        Args:
+            credential_name: Name of the credential
+            cli_value: Value from CLI argument (takes highest priority)
+            env_files: Result of _read_env_files(), or None to load on demand
+
+        Returns:
+            The credential value with quotes stripped, or None if not found
+        """
         # First check CLI argument
         if cli_value:
-            self._log_debug(f"Found {credential_name} from CLI argument")
+            self._log_debug("Found %s from CLI argument", credential_name)
             return cli_value.strip('"\'')
 
         # Then check environment variable
         env_value = os.environ.get(credential_name)
         if env_value:
-            self._log_debug(f"Found {credential_name} in environment variable")
+            self._log_debug("Found %s in environment variable", credential_name)
             return env_value.strip('"\'')
 
-        # Check local .env file
-        if self.local_env_path.exists():
-            try:
-                with open(self.local_env_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith(f'{credential_name}='):
-                            value = line.split('=', 1)[1].strip()
-                            self._log_debug(f"Found {credential_name} in local .env file")
-                            return value.strip('"\'')
-            except (IOError, OSError) as e:
-                self._log_debug(f"Could not read local .env file: {e}")
+        # Check local .env file, then global .env file
+        if env_files is None:
+            env_files = self._read_env_files()
+        for label, env_values in env_files:
+            value = env_values.get(credential_name)
+            if value is not None:
+                self._log_debug("Found %s in %s .env file", credential_name, label)
+                return value
+
+        return None
 
-        # Finally check global .env file
-        if self.global_env_path.exists():
+    def _read_env_files(self) -> List[Tuple[str, Mapping[str, str]]]:
+        """
+        Load the local and global .env files, in priority order.
+
+        Returns:
+            List of (label, values) for each .env file that could be read
+        """
+        env_files = []
+        for label, env_path in (('local', self.local_env_path), ('global', self.global_env_path)):
             try:
-                with open(self.global_env_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith(f'{credential_name}='):
-                            value = line.split('=', 1)[1].strip()
-                            self._log_debug(f"Found {credential_name} in global .env file")
-                            return value.strip('"\'')
+                env_values = _read_env_values(env_path)
             except (IOError, OSError) as e:
-                self._log_debug(f"Could not read global .env file: {e}")
-
-        return None
+                self._log_debug("Could not read %s .env file: %s", label, e)
+                continue
+            if env_values is not None:
+                env_files.append((label, env_values))
+        return env_files
 
     def require_credential(self, credential_name: str, cli_value: Optional[str] = None,
                           error_message: Optional[str] = None) -> str:
@@ -132,18 +217,23 @@ class CredentialManager:
         """
         credential = self.get_credential(credential_name, cli_value)
         if credential is None:
-            if error_message:
-                raise ValueError(error_message)
-            else:
-                raise ValueError(
-                    f"{credential_name} not found. Please provide via:\n"
-                    f"  1. CLI argument\n"
-                    f"  2. Environment variable: export {credential_name}='value'\n"
-                    f"  3. Local .env file: echo '{credential_name}=value' >> .env\n"
-                    f"  4. Global .env file: echo '{credential_name}=value' >> ~/.media-library-tools/.env"
-                )
+            raise self._missing_credential_error(credential_name, error_message)
         return credential
 
+    @staticmethod
+    def _missing_credential_error(credential_name: str,
+                                  error_message: Optional[str] = None) -> ValueError:
+        """Build the ValueError raised when a required credential is missing."""
+        if error_message:
+            return ValueError(error_message)
+        return ValueError(
+            f"{credential_name} not found. Please provide via:\n"
+            f"  1. CLI argument\n"
+            f"  2. Environment variable: export {credential_name}='value'\n"
+            f"  3. Local .env file: echo '{credential_name}=value' >> .env\n"
+            f"  4. Global .env file: echo '{credential_name}=value' >> ~/.media-library-tools/.env"
+        )
+
     def get_multiple_credentials(self, *credential_specs) -> dict:
         """
         Get multiple credentials at once.
@@ -167,6 +257,8 @@ class CredentialManager:
             >>> plex_token = creds.get('PLEX_TOKEN')  # May be None
         """
         credentials = {}
+        # Load the .env files once for the whole batch
+        env_files = self._read_env_files()
 
         for spec in credential_specs:
             if len(spec) == 2:
@@ -177,12 +269,11 @@ class CredentialManager:
             else:
                 raise ValueError(f"Invalid credential spec: {spec}")
 
-            if required:
-                credentials[credential_name] = self.require_credential(credential_name, cli_value)
-            else:
-                credential = self.get_credential(credential_name, cli_value)
-                if credential is not None:
-                    credentials[credential_name] = credential
+            credential = self._lookup_credential(credential_name, cli_value, env_files)
+            if credential is not None:
+                credentials[credential_name] = credential
+            elif required:
+                raise self._missing_credential_error(credential_name)
 
         return credentials
 
@@ -209,7 +300,7 @@ class CredentialManager:
 
             # Don't overwrite existing file
             if self.global_env_path.exists():
-                self._log_debug(f"Global .env file already exists at {self.global_env_path}")
+                self._log_debug("Global .env file already exists at %s", self.global_env_path)
                 return False
 
             # Create template
@@ -219,9 +310,9 @@ class CredentialManager:
                 for cred in credentials:
                     f.write(f"{cred}=your_{cred.lower()}_here\n")
 
-            self._log_debug(f"Created global .env template at {self.global_env_path}")
+            self._log_debug("Created global .env template at %s", self.global_env_path)
             return True
 
         except (IOError, OSError) as e:
-            self._log_debug(f"Failed to create global .env template: {e}")
+            self._log_debug("Failed to create global .env template: %s", e)
             return False
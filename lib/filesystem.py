@@ -16,53 +16,50 @@ in built tools while maintaining the self-contained principle.
 
 import os
 import shutil
-import subprocess
 from pathlib import Path
 from typing import List, Optional, Tuple, Set
 
+MEDIA_EXTENSIONS = frozenset({
+    # Video extensions
+    '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v',
+    '.mpg', '.mpeg', '.m2v', '.3gp', '.f4v', '.asf', '.rm', '.rmvb',
+    '.vob', '.ts', '.mts', '.m2ts',
+
+    # Audio extensions
+    '.mp3', '.flac', '.wav', '.aac', '.ogg', '.wma', '.m4a', '.opus',
+    '.ape', '.ac3', '.dts', '.aiff', '.au', '.ra'
+})
+
 
 def get_directory_size(path: str) -> int:
     """
-    Calculate total size of directory using system du command for accuracy.
-    
-    Args:
-        path: Directory path to analyze
-        
-    Returns:
-        Total size in bytes
-    """
-    try:
-        # Use du command for accurate size calculation
-        result = subprocess.run(['du', '-sb', path], 
-                              capture_output=True, text=True, check=True)
-        size_str = result.stdout.split()[0]
-        return int(size_str)
-    except (subprocess.CalledProcessError, ValueError, IndexError):
-        # Fallback to Python calculation
-        return _get_directory_size_python(path)
+    Calculate total size of all files under a directory.
 
+    Walks the tree with os.scandir so file sizes come from the directory
+    entries themselves; symlinks are counted by their own size and never
+    followed.
 
-def _get_directory_size_python(path: str) -> int:
-    """
-    Python fallback for directory size calculation.
-    
     Args:
         path: Directory path to analyze
-        
+
     Returns:
         Total size in bytes
     """
     total_size = 0
-    try:
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(filepath)
-                except (OSError, IOError):
-                    continue  # Skip inaccessible files
-    except (OSError, IOError):
-        pass
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except (OSError, IOError):
+                        continue  # Skip inaccessible entries
+        except (OSError, IOError):
+            continue  # Skip inaccessible directories
     return total_size
 
 
@@ -87,9 +84,10 @@ def validate_directory_path(path: str) -> Tuple[bool, str]:
     if not path_obj.is_dir():
         return False, f"Path is not a directory: {path}"
     
-    # Check if we can read the directory
+    # Check if we can read the directory; one entry is enough to prove it
     try:
-        list(path_obj.iterdir())
+        with os.scandir(path) as entries:
+            next(entries, None)
     except PermissionError:
         return False, f"Permission denied accessing directory: {path}"
     except OSError as e:
@@ -133,22 +131,26 @@ def get_subdirectories(path: str, max_depth: Optional[int] = None) -> List[str]:
         List of subdirectory paths
     """
     subdirs = []
-    
-    try:
-        for root, dirs, files in os.walk(path):
-            # Calculate current depth
-            if max_depth is not None:
-                current_depth = root[len(path):].count(os.sep)
-                if current_depth >= max_depth:
-                    dirs.clear()  # Don't recurse deeper
-                    continue
-            
-            for dir_name in dirs:
-                subdir_path = os.path.join(root, dir_name)
-                subdirs.append(subdir_path)
-                
-    except (OSError, IOError):
-        pass  # Skip inaccessible directories
+    stack = [(path, 0)]
+    
+    while stack:
+        current, depth = stack.pop()
+        if max_depth is not None and depth >= max_depth:
+            continue  # Don't recurse deeper
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_dir():
+                            continue
+                        subdirs.append(entry.path)
+                        # Like os.walk, list symlinked directories but don't descend
+                        if not entry.is_symlink():
+                            stack.append((entry.path, depth + 1))
+                    except (OSError, IOError):
+                        continue
+        except (OSError, IOError):
+            continue  # Skip inaccessible directories
     
     return sorted(subdirs)
 
@@ -163,18 +165,9 @@ def is_media_file(filename: str) -> bool:
     Returns:
         True if file appears to be a media file
     """
-    media_extensions = {
-        # Video extensions
-        '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v',
-        '.mpg', '.mpeg', '.m2v', '.3gp', '.f4v', '.asf', '.rm', '.rmvb',
-        '.vob', '.ts', '.mts', '.m2ts',
-        
-        # Audio extensions
-        '.mp3', '.flac', '.wav', '.aac', '.ogg', '.wma', '.m4a', '.opus',
-        '.ape', '.ac3', '.dts', '.aiff', '.au', '.ra'
-    }
-    
-    return Path(filename).suffix.lower() in media_extensions
+    # Same rules as Path.suffix: no suffix for dotfiles or a trailing dot
+    dot = filename.rfind('.')
+    return 0 < dot < len(filename) - 1 and filename[dot:].lower() in MEDIA_EXTENSIONS
 
 
 def count_files_by_type(directory: str) -> dict:
@@ -195,18 +188,19 @@ def count_files_by_type(directory: str) -> dict:
     }
     
     try:
-        for item in Path(directory).iterdir():
-            if item.is_file():
-                if is_media_file(item.name):
-                    counts['media_files'] += 1
-                else:
-                    counts['other_files'] += 1
-                try:
-                    counts['total_size'] += item.stat().st_size
-                except (OSError, IOError):
-                    pass
-            elif item.is_dir():
-                counts['subdirectories'] += 1
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if is_media_file(entry.name):
+                        counts['media_files'] += 1
+                    else:
+                        counts['other_files'] += 1
+                    try:
+                        counts['total_size'] += entry.stat().st_size
+                    except (OSError, IOError):
+                        pass
+                elif entry.is_dir():
+                    counts['subdirectories'] += 1
                 
     except (OSError, IOError):
         pass  # Skip inaccessible directories
@@ -19,6 +19,58 @@ to extract metadata from file and directory names across media library tools.
 import re
 from typing import Optional, Tuple, List
 
+# Year capture group used by the year patterns; specialized per parser
+_YEAR_GROUP = r'(\d{4})'
+
+
+def _digit_range_patterns(low: str, high: str) -> List[str]:
+    """
+    Build regex alternatives matching every number from low to high.
+
+    Both bounds must be digit strings of the same length.
+
+    Args:
+        low: Lower bound (inclusive)
+        high: Upper bound (inclusive)
+
+    Returns:
+        List of regex fragments whose alternation matches exactly the range
+    """
+    if low == high:
+        return [low]
+    if len(low) == 1:
+        return [f'[{low}-{high}]']
+    if low[0] == high[0]:
+        return [low[0] + rest for rest in _digit_range_patterns(low[1:], high[1:])]
+
+    width = len(low) - 1
+    parts = []
+    first, last = int(low[0]), int(high[0])
+    if low[1:] != '0' * width:
+        parts.extend(low[0] + rest for rest in _digit_range_patterns(low[1:], '9' * width))
+        first += 1
+    if high[1:] != '9' * width:
+        last -= 1
+    if first <= last:
+        lead = str(first) if first == last else f'[{first}-{last}]'
+        parts.append(lead + r'\d' * width)
+    if high[1:] != '9' * width:
+        parts.extend(high[0] + rest for rest in _digit_range_patterns('0' * width, high[1:]))
+    return parts
+
+
+def _year_range_group(min_year: int, max_year: int) -> str:
+    """
+    Build a capture group matching only four-digit years in [min_year, max_year].
+
+    Falls back to the generic four-digit group when the range cannot be
+    expressed with four-digit numbers.
+    """
+    if not 1000 <= min_year <= max_year <= 9999:
+        return _YEAR_GROUP
+    return '(' + '|'.join(_digit_range_patterns(str(min_year), str(max_year))) + ')'
+
+
 
 class MediaNameParser:
     """Parser for extracting metadata from media file and directory names."""
@@ -42,6 +94,22 @@ class MediaNameParser:
         (r'\b(\d{4})\b', 'Standalone year YYYY'),
     ]
 
+    # Any year worth extracting contains a run of four digits
+    _FOUR_DIGITS_RE = re.compile(r'\d{4}')
+
+    # Cleanup patterns applied by clean_show_name after years are removed
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _TRAILING_PUNCT_RE = re.compile(r'[._-]+$')
+    _LEADING_PUNCT_RE = re.compile(r'^[._-]+')
+
+    # Templates for format_name_with_year, keyed by format style
+    YEAR_FORMATS = {
+        'parentheses': '{name} ({year})',
+        'brackets': '{name} [{year}]',
+        'space': '{name} {year}',
+        'dash': '{name} - {year}',
+    }
+
     def __init__(self, year_patterns: Optional[List[Tuple[str, str]]] = None,
                  min_year: int = 1900, max_year: int = 2030, debug: bool = False):
         """
@@ -55,6 +123,22 @@ class MediaNameParser:
             debug: Enable debug output
         """
         self.year_patterns = year_patterns if year_patterns is not None else self.DEFAULT_YEAR_PATTERNS
+
+        # Fold the year range into the patterns so out-of-range numbers are
+        # rejected by the regex engine; patterns without the standard year
+        # group are used as-is and still range-checked in Python
+        year_group = _year_range_group(min_year, max_year)
+        specialized = [(pattern.replace(_YEAR_GROUP, year_group), description)
+                       for pattern, description in self.year_patterns]
+        self._compiled_patterns = [(re.compile(pattern), description)
+                                   for pattern, description in specialized]
+        # All patterns in one alternation: a single engine pass answers
+        # "is there any year here?" in extract_year, and the unspecialized
+        # form lets clean_show_name skip names no pattern matches
+        self._year_search_re = re.compile('|'.join(f'(?:{pattern})' for pattern, _ in specialized))
+        self._combined_re = re.compile('|'.join(f'(?:{pattern})' for pattern, _ in self.year_patterns))
+        # Unspecialized patterns, removed one after another by clean_show_name
+        self._strip_patterns = [re.compile(pattern) for pattern, _ in self.year_patterns]
         self.min_year = min_year
         self.max_year = max_year
         self.debug = debug
@@ -81,14 +165,41 @@ class MediaNameParser:
             >>> parser.extract_year("Show Name")
             None
         """
-        for pattern, description in self.year_patterns:
-            match = re.search(pattern, name)
+        result = self.extract_year_with_span(name)
+        return result[0] if result else None
+
+    def extract_year_with_span(self, name: str) -> Optional[Tuple[int, Tuple[int, int]]]:
+        """
+        Extract year from media name along with the span of the matched text.
+
+        Uses the same pattern order and validation as extract_year(). The span
+        covers the whole pattern match (e.g. "(2008)" including parentheses),
+        so callers can splice the year out of the name without searching again.
+
+        Args:
+            name: Media file or directory name
+
+        Returns:
+            Tuple of (year, (start, end)), or None if no valid year found
+
+        Example:
+            >>> parser = MediaNameParser()
+            >>> parser.extract_year_with_span("Breaking Bad (2008)")
+            (2008, (13, 19))
+        """
+        # Most names carry no year at all; a digit-run scan rules them out
+        # cheaply, and the combined pattern handles the rest in one search
+        if not self._FOUR_DIGITS_RE.search(name) or not self._year_search_re.search(name):
+            return None
+
+        for pattern, description in self._compiled_patterns:
+            match = pattern.search(name)
             if match:
                 year = int(match.group(1))
                 if self.min_year <= year <= self.max_year:
                     if self.debug:
                         print(f"DEBUG: Extracted year {year} using {description}")
-                    return year
+                    return year, match.span()
                 elif self.debug:
                     print(f"DEBUG: Year {year} out of range ({self.min_year}-{self.max_year})")
         return None
@@ -113,17 +224,20 @@ class MediaNameParser:
             >>> parser.clean_show_name("The.Wire.[2002]")
             'The Wire'
             >>> parser.clean_show_name("Show Name - 2010 - Season 1")
-            'Show Name  Season 1'
+            'Show Name -- Season 1'
         """
-        # Remove year patterns
+        # Remove year patterns one after another; a removal can expose a
+        # match for a later pattern, so this is not a single combined pass.
+        # Names no pattern matches are left alone without trying each one
         cleaned = name
-        for pattern, _ in self.year_patterns:
-            cleaned = re.sub(pattern, '', cleaned)
+        if self._combined_re.search(name):
+            for pattern in self._strip_patterns:
+                cleaned = pattern.sub('', cleaned)
 
         # Clean up extra spaces and punctuation
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        cleaned = re.sub(r'[._-]+$', '', cleaned)  # Remove trailing punctuation
-        cleaned = re.sub(r'^[._-]+', '', cleaned)  # Remove leading punctuation
+        cleaned = self._WHITESPACE_RE.sub(' ', cleaned).strip()
+        cleaned = self._TRAILING_PUNCT_RE.sub('', cleaned)  # Remove trailing punctuation
+        cleaned = self._LEADING_PUNCT_RE.sub('', cleaned)  # Remove leading punctuation
 
         return cleaned
 
@@ -189,16 +303,6 @@ class MediaNameParser:
             >>> parser.format_name_with_year("Breaking Bad", 2008, 'brackets')
             'Breaking Bad [2008]'
         """
-        base_name = base_name.strip()
-
-        if format_style == 'parentheses':
-            return f"{base_name} ({year})"
-        elif format_style == 'brackets':
-            return f"{base_name} [{year}]"
-        elif format_style == 'space':
-            return f"{base_name} {year}"
-        elif format_style == 'dash':
-            return f"{base_name} - {year}"
-        else:
-            # Default to parentheses
-            return f"{base_name} ({year})"
+        # Unknown styles default to parentheses
+        template = self.YEAR_FORMATS.get(format_style, self.YEAR_FORMATS['parentheses'])
+        return template.format(name=base_name.strip(), year=year)
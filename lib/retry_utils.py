@@ -16,45 +16,102 @@ This module provides shared retry functionality for API clients and network oper
 across media library tools.
 """
 
+import functools
+import socket
 import time
 import random
 import urllib.error
 from typing import Callable, Any
 
+# Supported jitter strategies for retry_with_backoff
+JITTER_MODES = ('decorrelated', 'full', 'none', 'legacy')
 
-def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0, multiplier: float = 2.0, max_delay: float = 30.0):
+# Errors raised before a request reaches the server (refused connection,
+# failed DNS lookup); retrying these cannot repeat a request
+_PRE_REQUEST_ERRORS = (ConnectionRefusedError, socket.gaierror)
+
+
+def _is_pre_request_error(error: Exception) -> bool:
+    """
+    Check whether an error happened before the request was sent.
+
+    Args:
+        error: Exception raised by the wrapped call
+
+    Returns:
+        True if the server cannot have received the request
+    """
+    if isinstance(error, urllib.error.HTTPError):
+        return False
+    if isinstance(error, urllib.error.URLError):
+        error = error.reason
+    return isinstance(error, _PRE_REQUEST_ERRORS)
+
+
+def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0, multiplier: float = 2.0,
+                       max_delay: float = 30.0, jitter: str = 'decorrelated',
+                       idempotent: bool = True):
     """
     Decorator to retry function calls with exponential backoff.
 
     Implements exponential backoff with jitter to handle transient network failures
     and rate limiting. Intelligently classifies errors to determine retriability.
 
+    Jitter modes:
+        'decorrelated': Random delay between base_delay and 3x the previous
+                        delay, capped at max_delay. Spreads out clients that
+                        fail together (e.g. parallel cron jobs) so they don't
+                        retry in lockstep. multiplier is not used.
+        'full': Random delay between 0 and the exponential delay.
+        'none': Plain exponential delay.
+        'legacy': Exponential delay plus 0.1-0.5s of random padding.
+
+    Non-idempotent calls (e.g. a POST that creates a session) are only
+    retried when the request never reached the server, so a request the
+    server may already have processed is not sent twice.
+
     Args:
         max_retries: Maximum number of retry attempts (default: 3)
         base_delay: Base delay in seconds before first retry (default: 1.0)
         multiplier: Multiplier for exponential backoff (default: 2.0)
         max_delay: Maximum delay between retries (default: 30.0)
+        jitter: Jitter mode, one of JITTER_MODES (default: 'decorrelated')
+        idempotent: Whether the call is safe to repeat (default: True)
 
     Returns:
         Decorated function with retry logic
 
+    Raises:
+        ValueError: If jitter is not a supported mode
+
     Example:
         @retry_with_backoff(max_retries=5, base_delay=2.0)
         def fetch_data(self, url):
             response = urllib.request.urlopen(url)
             return response.read()
+
+        @retry_with_backoff(idempotent=False)
+        def create_session(self, payload):
+            ...
     """
+    if jitter not in JITTER_MODES:
+        raise ValueError(f"Unknown jitter mode '{jitter}', expected one of {', '.join(JITTER_MODES)}")
+
     def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             last_exception = None
+            # Bound instance (self) that may carry retry statistics and debug flag
+            owner = args[0] if args else None
+            prev_delay = base_delay
 
             for attempt in range(max_retries + 1):
                 try:
                     result = func(*args, **kwargs)
 
                     # Track successful retry if this wasn't the first attempt
-                    if attempt > 0 and args and hasattr(args[0], 'retry_successes'):
-                        args[0].retry_successes += 1
+                    if attempt > 0 and hasattr(owner, 'retry_successes'):
+                        owner.retry_successes += 1
 
                     return result
 
@@ -66,7 +123,10 @@ def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0, multiplier
                         break
 
                     # Determine if error is retriable
-                    if isinstance(e, urllib.error.HTTPError):
+                    if not idempotent:
+                        # Only retry if the server cannot have seen the request
+                        is_retriable = _is_pre_request_error(e)
+                    elif isinstance(e, urllib.error.HTTPError):
                         # Retry on server errors and rate limiting
                         if e.code in [429, 500, 502, 503, 504]:
                             is_retriable = True
@@ -81,20 +141,23 @@ def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0, multiplier
                         break
 
                     # Calculate delay with exponential backoff and jitter
-                    delay = min(base_delay * (multiplier ** attempt), max_delay)
-                    jitter = random.uniform(0.1, 0.5)  # Add jitter to prevent thundering herd
-                    delay += jitter
+                    if jitter == 'decorrelated':
+                        delay = min(max_delay, base_delay + random.random() * (prev_delay * 3 - base_delay))
+                        prev_delay = delay
+                    elif jitter == 'full':
+                        delay = random.random() * min(base_delay * (multiplier ** attempt), max_delay)
+                    elif jitter == 'none':
+                        delay = min(base_delay * (multiplier ** attempt), max_delay)
+                    else:
+                        delay = min(base_delay * (multiplier ** attempt), max_delay)
+                        delay += 0.1 + 0.4 * random.random()
 
                     # Update retry statistics if available in args/self
-                    if args and hasattr(args[0], 'retry_attempts'):
-                        args[0].retry_attempts += 1
+                    if hasattr(owner, 'retry_attempts'):
+                        owner.retry_attempts += 1
 
                     # Log retry attempt if debug is available in args/self
-                    debug = False
-                    if args and hasattr(args[0], 'debug'):
-                        debug = args[0].debug
-
-                    if debug:
+                    if getattr(owner, 'debug', False):
                         print(f"Retry attempt {attempt + 1}/{max_retries} after {delay:.1f}s delay. Error: {e}")
 
                     time.sleep(delay)
@@ -24,50 +24,136 @@ advanced detection capabilities.
 """
 
 import re
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple, Any
+
+
+# Pattern categories, derived once from each pattern description
+_CATEGORY_STANDARD = 0
+_CATEGORY_EXTENDED = 1
+_CATEGORY_ENHANCED_S = 2
+_CATEGORY_ENHANCED_X = 3
+_CATEGORY_ENHANCED = 4
+_CATEGORY_NUMERIC = 5
+_CATEGORY_YEAR = 6
+
+# Valid season range (inclusive) per category; None means never valid
+_CATEGORY_RANGES = (
+    (1, 50),                # _CATEGORY_STANDARD
+    (100, 2050),            # _CATEGORY_EXTENDED
+    (1, 2050),              # _CATEGORY_ENHANCED_S
+    (1, 500),               # _CATEGORY_ENHANCED_X
+    None,                   # _CATEGORY_ENHANCED
+    (1, 50),                # _CATEGORY_NUMERIC
+    (1990, float('inf')),   # _CATEGORY_YEAR
+)
+
+
+@lru_cache(maxsize=None)
+def _pattern_category(pattern_desc: str) -> int:
+    """
+    Classify a pattern description into a pattern category.
+
+    Args:
+        pattern_desc: Pattern description
+
+    Returns:
+        One of the _CATEGORY_* constants
+    """
+    if 'Year format' in pattern_desc:
+        return _CATEGORY_YEAR
+    if 'Extended' in pattern_desc:
+        return _CATEGORY_EXTENDED
+    if 'numeric' in pattern_desc.lower():
+        return _CATEGORY_NUMERIC
+    if 'Enhanced' in pattern_desc:
+        if 'S#' in pattern_desc:
+            return _CATEGORY_ENHANCED_S
+        if '#x#' in pattern_desc:
+            return _CATEGORY_ENHANCED_X
+        return _CATEGORY_ENHANCED
+    return _CATEGORY_STANDARD
+
+
+@lru_cache(maxsize=None)
+def _compile_season_patterns(
+        patterns: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[Tuple[Pattern, str], ...], Pattern]:
+    """
+    Compile season patterns once per distinct pattern set.
+
+    Args:
+        patterns: (regex, description) tuples in priority order
+
+    Returns:
+        Tuple of (compiled (pattern, description) pairs, combined alternation)
+    """
+    compiled = tuple((re.compile(pattern, re.IGNORECASE), description)
+                     for pattern, description in patterns)
+    combined = re.compile('|'.join(f'(?:{pattern})' for pattern, _ in patterns), re.IGNORECASE)
+    return compiled, combined
+
+
+@lru_cache(maxsize=None)
+def _tag_season_patterns(
+        patterns: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[Pattern, str, int, Optional[Tuple]], ...]:
+    """
+    Tag compiled season patterns with their category and valid range.
+
+    Args:
+        patterns: (regex, description) tuples in priority order
+
+    Returns:
+        Tuple of (compiled pattern, description, category, range) entries
+    """
+    compiled, _ = _compile_season_patterns(patterns)
+    tagged = []
+    for pattern, description in compiled:
+        category = _pattern_category(description)
+        tagged.append((pattern, description, category, _CATEGORY_RANGES[category]))
+    return tuple(tagged)
 
 
-@dataclass
 class SeasonPatternDefinitions:
     """
     Centralized season pattern definitions with metadata.
 
     All patterns are ordered by specificity and priority to ensure
-    the most accurate match is found first.
+    the most accurate match is found first. Pattern groups are immutable
+    class-level tuples shared by every instance.
     """
 
     # Standard patterns (highest priority) - S01E01, Season 1
-    STANDARD_PATTERNS: List[Tuple[str, str]] = field(default_factory=lambda: [
+    STANDARD_PATTERNS: Tuple[Tuple[str, str], ...] = (
         (r'[Ss](\d{1,2})[Ee]\d{1,3}', 'S{:02d}E format'),
         (r'[Ss]eason[\s\._-]*(\d{1,2})', 'Season X format'),
-    ])
+    )
 
     # Extended season patterns (high priority) - S100+
-    EXTENDED_PATTERNS: List[Tuple[str, str]] = field(default_factory=lambda: [
+    EXTENDED_PATTERNS: Tuple[Tuple[str, str], ...] = (
         (r'[Ss](\d{3,4})[Ee]\d{1,3}', 'Extended season S###/####E## format'),
         (r'[Ss]eason[\s\._-]*(\d{3,4})', 'Extended Season #### format'),
-    ])
+    )
 
     # Enhanced alternative patterns (medium-high priority)
-    ENHANCED_ALTERNATIVE: List[Tuple[str, str]] = field(default_factory=lambda: [
+    ENHANCED_ALTERNATIVE: Tuple[Tuple[str, str], ...] = (
         (r'(\d{1,3})x\d{1,3}', 'Enhanced season #x# format'),
         (r'[Ss](\d{1,4})\D', 'Enhanced S# format'),
-    ])
+    )
 
     # Numeric-only patterns (medium priority)
-    NUMERIC_ONLY: List[Tuple[str, str]] = field(default_factory=lambda: [
+    NUMERIC_ONLY: Tuple[Tuple[str, str], ...] = (
         (r'(?:ep|episode)[\s\-_.]*(\d{1,2})(?:[^\d]|$)', 'Episode-prefixed numeric format'),
         (r'(?:^|[\s\-_.])[^\d]*[\s\-_.](\d{1,2})[\s\-_.](?!\d*(?:p|fps|kbps))', 'Separated numeric format'),
-    ])
+    )
 
     # Year-based seasons (special handling)
-    YEAR_BASED: List[Tuple[str, str]] = field(default_factory=lambda: [
+    YEAR_BASED: Tuple[Tuple[str, str], ...] = (
         (r'[\(\[]?(20\d{2})[\)\]]?', 'Year format'),
-    ])
+    )
 
     # Episode/media patterns (various priorities)
-    EPISODE_PATTERNS: List[Tuple[str, str]] = field(default_factory=lambda: [
+    EPISODE_PATTERNS: Tuple[Tuple[str, str], ...] = (
         # Episode numbering patterns
         (r'[Ee]pisode[\s\._-]*(\d{1,3})', 'Episode X format'),
         (r'[Ee]p[\s\._-]*(\d{1,3})', 'Ep X format'),
@@ -80,23 +166,39 @@ class SeasonPatternDefinitions:
         # Volume patterns
         (r'[Vv]ol[\s\._-]*(\d{1,2})', 'Vol X format'),
         (r'[Vv](\d{1,2})', 'V1 format'),
-    ])
-
-    def get_all_patterns(self) -> List[Tuple[str, str]]:
+    )
+
+    # All patterns in priority order, concatenated once at import
+    ALL_PATTERNS: Tuple[Tuple[str, str], ...] = (
+        STANDARD_PATTERNS +
+        EXTENDED_PATTERNS +
+        ENHANCED_ALTERNATIVE +
+        YEAR_BASED +
+        EPISODE_PATTERNS +
+        NUMERIC_ONLY
+    )
+
+    def get_all_patterns(self) -> Tuple[Tuple[str, str], ...]:
         """
         Get all patterns in priority order.
 
         Returns:
-            List of (regex, description) tuples
+            Tuple of (regex, description) tuples
+        """
+        return self.ALL_PATTERNS
+
+    def get_compiled_patterns(self) -> Tuple[Tuple[Tuple[Pattern, str], ...], Pattern]:
         """
-        return (
-            self.STANDARD_PATTERNS +
-            self.EXTENDED_PATTERNS +
-            self.ENHANCED_ALTERNATIVE +
-            self.YEAR_BASED +
-            self.EPISODE_PATTERNS +
-            self.NUMERIC_ONLY
-        )
+        Get all patterns compiled, in priority order.
+
+        Compiled patterns are shared by every instance with the same pattern
+        set, so each detector does not recompile them.
+
+        Returns:
+            Tuple of (compiled (pattern, description) pairs, combined pattern
+            matching wherever any individual pattern would match)
+        """
+        return _compile_season_patterns(self.get_all_patterns())
 
 
 class SeasonValidationEngine:
@@ -110,13 +212,14 @@ class SeasonValidationEngine:
     - Context character analysis
     """
 
-    # Quality indicators that should be rejected
-    QUALITY_PATTERNS = [
+    # Quality indicators that should be rejected; a tuple so it can key the
+    # memoized quality check directly
+    QUALITY_PATTERNS = (
         r'720p', r'1080p', r'480p', r'2160p', r'4K',
         r'\d+kbps', r'\d+fps', r'HDR', r'DTS', r'AC3',
         r'H\.?264', r'H\.?265', r'x264', r'x265',
         r'HEVC', r'AVC', r'BluRay', r'WEBRip', r'DVDRip'
-    ]
+    )
 
     # Positive indicators for season detection
     POSITIVE_INDICATORS = ['ep', 'episode', 'season', 'series', '-', '_', '.', ' ']
@@ -124,6 +227,12 @@ class SeasonValidationEngine:
     # Negative indicators that reduce confidence
     NEGATIVE_INDICATORS = ['p', 'fps', 'kbps', 'bit', 'mb', 'gb']
 
+    # (indicator, confidence adjustment) pairs checked in a single pass
+    INDICATOR_WEIGHTS = tuple(
+        [(indicator, 0.1) for indicator in POSITIVE_INDICATORS] +
+        [(indicator, -0.2) for indicator in NEGATIVE_INDICATORS]
+    )
+
     def detect_quality_indicators(self, filename: str) -> bool:
         """
         Detect if filename contains quality indicators.
@@ -134,11 +243,8 @@ class SeasonValidationEngine:
         Returns:
             True if quality indicators detected, False otherwise
         """
-        filename_lower = filename.lower()
-        for pattern in self.QUALITY_PATTERNS:
-            if re.search(pattern, filename_lower, re.IGNORECASE):
-                return True
-        return False
+        # The cache key must be hashable; overrides may assign a list
+        return _has_quality_indicator(filename, tuple(self.QUALITY_PATTERNS))
 
     def validate_position(self, filename: str, match_pos: int) -> float:
         """
@@ -175,22 +281,12 @@ class SeasonValidationEngine:
         Returns:
             True if valid range, False otherwise
         """
-        if 'Extended' in pattern_desc:
-            return 100 <= season_num <= 2050
-        elif 'numeric' in pattern_desc.lower():
-            return 1 <= season_num <= 50
-        elif 'Enhanced' in pattern_desc:
-            if 'S#' in pattern_desc:
-                return 1 <= season_num <= 2050
-            elif '#x#' in pattern_desc:
-                return 1 <= season_num <= 500
-        elif 'Year format' in pattern_desc:
-            return season_num >= 1990
-        else:
-            return 1 <= season_num <= 50
+        season_range = _CATEGORY_RANGES[_pattern_category(pattern_desc)]
+        return season_range is not None and season_range[0] <= season_num <= season_range[1]
 
     def calculate_confidence_score(self, filename: str, match_text: str,
-                                   season_num: int, pattern_desc: str) -> float:
+                                   season_num: int, pattern_desc: str,
+                                   match_pos: Optional[int] = None) -> float:
         """
         Calculate comprehensive confidence score for a match.
 
@@ -199,6 +295,8 @@ class SeasonValidationEngine:
             match_text: Matched text from pattern
             season_num: Extracted season number
             pattern_desc: Pattern description
+            match_pos: Start of the match in filename, when the caller has it
+                       (default: first occurrence of match_text)
 
         Returns:
             Confidence score (0.0-1.0)
@@ -206,15 +304,17 @@ class SeasonValidationEngine:
         confidence = 0.0
 
         # Position-based adjustment
-        match_pos = filename.find(match_text)
+        if match_pos is None:
+            match_pos = filename.find(match_text)
         confidence += self.validate_position(filename, match_pos)
 
         # Range-based confidence boost
-        if 'Extended' in pattern_desc:
+        category = _pattern_category(pattern_desc)
+        if category == _CATEGORY_EXTENDED:
             confidence += 0.4
-        elif 'numeric' in pattern_desc.lower():
+        elif category == _CATEGORY_NUMERIC:
             confidence += 0.2
-        elif 'Enhanced' in pattern_desc:
+        elif category in (_CATEGORY_ENHANCED_S, _CATEGORY_ENHANCED_X, _CATEGORY_ENHANCED):
             confidence += 0.3
 
         # Context character analysis
@@ -223,13 +323,9 @@ class SeasonValidationEngine:
         context_end = min(filename_length, match_pos + len(match_text) + 3)
         context = filename[context_start:context_end].lower()
 
-        for indicator in self.POSITIVE_INDICATORS:
-            if indicator in context:
-                confidence += 0.1
-
-        for indicator in self.NEGATIVE_INDICATORS:
+        for indicator, weight in self.INDICATOR_WEIGHTS:
             if indicator in context:
-                confidence -= 0.2
+                confidence += weight
 
         # Filename structure analysis
         if any(sep in filename for sep in [' - ', '.', '_', 'S0', 's0', 'Season', 'season']):
@@ -239,7 +335,8 @@ class SeasonValidationEngine:
         return max(0.0, min(1.0, confidence))
 
     def validate_numeric_season(self, filename: str, match_text: str,
-                               season_num: int, pattern_desc: str) -> Tuple[bool, float]:
+                               season_num: int, pattern_desc: str,
+                               match_pos: Optional[int] = None) -> Tuple[bool, float]:
         """
         Validate that a numeric match represents a season.
 
@@ -248,6 +345,7 @@ class SeasonValidationEngine:
             match_text: Matched text from pattern
             season_num: Extracted season number
             pattern_desc: Pattern description
+            match_pos: Start of the match in filename, if known
 
         Returns:
             Tuple of (is_valid, confidence_score)
@@ -261,14 +359,117 @@ class SeasonValidationEngine:
             return False, 0.0
 
         # Calculate confidence
-        confidence = self.calculate_confidence_score(filename, match_text, season_num, pattern_desc)
+        confidence = self.calculate_confidence_score(filename, match_text, season_num,
+                                                     pattern_desc, match_pos)
 
         # Apply minimum confidence threshold
-        min_confidence = 0.3 if 'numeric' in pattern_desc.lower() else 0.2
+        min_confidence = 0.3 if _pattern_category(pattern_desc) == _CATEGORY_NUMERIC else 0.2
 
         return confidence >= min_confidence, confidence
 
 
+_NO_SEASON_MATCH = (None, "No pattern matched", "", None)
+
+# Any season pattern needs at least one digit to match
+_DIGIT_RE = re.compile(r'\d')
+
+
+@lru_cache(maxsize=8192)
+def _season_candidates(filename: str, patterns: Tuple[Tuple[str, str], ...]
+                       ) -> Tuple[Tuple[int, str, str, int, int], ...]:
+    """
+    Find the in-range season pattern matches in a filename, memoized per filename.
+
+    Only the pure pattern matching is cached, so results are shared by all
+    detectors. Bulk runs see the same basenames repeatedly (dry run then real
+    run, rescans). Validation of numeric matches is left to the caller.
+
+    Args:
+        filename: Filename to analyze
+        patterns: (regex, description) tuples in priority order
+
+    Returns:
+        (season_number, pattern_description, matched_text, category,
+        match_start) tuples in priority order, ending at the first
+        non-numeric match, which needs no further validation
+    """
+    _, any_pattern = _compile_season_patterns(patterns)
+
+    # Every pattern captures a number, so names without digits are skipped
+    # outright; one combined search then rules out the remaining names no
+    # pattern can match, and the loop below keeps the priority order
+    if not _DIGIT_RE.search(filename) or not any_pattern.search(filename):
+        return ()
+
+    candidates = []
+    for pattern, description, category, season_range in _tag_season_patterns(patterns):
+        match = pattern.search(filename)
+        if match:
+            try:
+                season_num = int(match.group(1))
+            except (ValueError, IndexError):
+                continue
+
+            # Range check against the precomputed range of the pattern
+            if season_range is None or not season_range[0] <= season_num <= season_range[1]:
+                continue
+            candidates.append((season_num, description, match.group(0), category, match.start()))
+            if category != _CATEGORY_NUMERIC:
+                break
+
+    return tuple(candidates)
+
+
+def _match_season_info(filename: str, patterns: Tuple[Tuple[str, str], ...],
+                       validator: SeasonValidationEngine
+                       ) -> Tuple[Optional[int], str, str, Optional[float]]:
+    """
+    Match a filename against season patterns.
+
+    Statistics are updated by the caller.
+
+    Args:
+        filename: Filename to analyze
+        patterns: (regex, description) tuples in priority order
+        validator: Validation engine for numeric patterns
+
+    Returns:
+        Tuple of (season_number, pattern_description, matched_text,
+        confidence), where confidence is only set for numeric patterns
+    """
+    for season_num, description, matched_text, category, match_start in _season_candidates(filename, patterns):
+        # Numeric patterns also need the full validation
+        if category != _CATEGORY_NUMERIC:
+            return season_num, description, matched_text, None
+        is_valid, confidence = validator.validate_numeric_season(
+            filename, matched_text, season_num, description, match_start)
+        if is_valid:
+            return season_num, description, matched_text, confidence
+
+    return _NO_SEASON_MATCH
+
+
+@lru_cache(maxsize=None)
+def _compile_quality_patterns(patterns: Tuple[str, ...]) -> Pattern:
+    """Compile quality indicator regexes into one case-insensitive alternation."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
+@lru_cache(maxsize=8192)
+def _has_quality_indicator(filename: str, patterns: Tuple[str, ...]) -> bool:
+    """
+    Check a filename for quality indicators, memoized per filename.
+
+    Args:
+        filename: Filename to check
+        patterns: Quality indicator regexes
+
+    Returns:
+        True if any quality indicator matches
+    """
+    return _compile_quality_patterns(patterns).search(filename) is not None
+
+
 class BaseSeasonDetector:
     """
     Base class for season detection shared between plex scripts.
@@ -288,12 +489,15 @@ class BaseSeasonDetector:
         self.patterns = SeasonPatternDefinitions()
         self.validator = SeasonValidationEngine()
         self.season_patterns = self.patterns.get_all_patterns()
+        self._season_pattern_key = tuple(self.season_patterns)
 
         # Statistics tracking
         self.stats = {
-            'season_patterns_found': {},
+            'season_patterns_found': Counter(),
             'validation_results': {},
-            'confidence_scores': []
+            # Running mean of numeric-pattern confidence scores
+            'confidence_count': 0,
+            'confidence_mean': 0.0
         }
 
     def extract_season_info(self, filename: str) -> Tuple[Optional[int], str, str]:
@@ -307,45 +511,31 @@ class BaseSeasonDetector:
             Tuple of (season_number, pattern_description, matched_text)
             Returns (None, "No pattern matched", "") if no match found
         """
-        for pattern, description in self.season_patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
-            if match:
-                try:
-                    season_num = int(match.group(1))
-                    matched_text = match.group(0)
-
-                    # Pattern-specific validation
-                    if 'Year format' in description:
-                        if season_num >= 1990:
-                            self._track_pattern_usage(description, True)
-                            return season_num, description, matched_text
-                    elif 'Extended' in description:
-                        if 100 <= season_num <= 2050:
-                            self._track_pattern_usage(description, True)
-                            return season_num, description, matched_text
-                    elif 'numeric' in description.lower():
-                        is_valid, confidence = self.validator.validate_numeric_season(
-                            filename, matched_text, season_num, description)
-                        if is_valid:
-                            self._track_pattern_usage(description, True)
-                            self.stats['confidence_scores'].append(confidence)
-                            return season_num, description, matched_text
-                    elif 'Enhanced' in description:
-                        if 'S#' in description and 1 <= season_num <= 2050:
-                            self._track_pattern_usage(description, True)
-                            return season_num, description, matched_text
-                        elif '#x#' in description and 1 <= season_num <= 500:
-                            self._track_pattern_usage(description, True)
-                            return season_num, description, matched_text
-                    elif 1 <= season_num <= 50:
-                        self._track_pattern_usage(description, True)
-                        return season_num, description, matched_text
-
-                except (ValueError, IndexError):
-                    continue
-
-        self._track_pattern_usage("No pattern matched", False)
-        return None, "No pattern matched", ""
+        season_num, description, matched_text, confidence = _match_season_info(
+            filename, self._season_pattern_key, self.validator)
+
+        self._track_pattern_usage(description, season_num is not None)
+        if confidence is not None:
+            self._track_confidence(confidence)
+        return season_num, description, matched_text
+
+    def extract_season_info_batch(self, filenames: List[str]) -> List[Tuple[Optional[int], str, str]]:
+        """
+        Extract season information for many filenames at once.
+
+        The combined pattern and per-pattern regexes are compiled once and
+        shared, and repeated names are served from the detection cache.
+        Subclass overrides of extract_season_info() are honoured.
+
+        Args:
+            filenames: Filenames to analyze
+
+        Returns:
+            List of (season_number, pattern_description, matched_text) tuples,
+            in the same order as filenames
+        """
+        extract = self.extract_season_info
+        return [extract(filename) for filename in filenames]
 
     def generate_season_directory_name(self, season_num: int, pattern_desc: str) -> str:
         """
@@ -358,12 +548,10 @@ class BaseSeasonDetector:
         Returns:
             Season directory name (e.g., "Season 01" or "Season 100")
         """
-        if 'Year format' in pattern_desc:
+        category = _pattern_category(pattern_desc)
+        if category in (_CATEGORY_YEAR, _CATEGORY_EXTENDED) or season_num >= 100:
             return f"Season {season_num}"
-        elif 'Extended' in pattern_desc or season_num >= 100:
-            return f"Season {season_num}"
-        else:
-            return f"Season {season_num:02d}"
+        return f"Season {season_num:02d}"
 
     def get_season_patterns(self) -> List[Tuple[str, str]]:
         """
@@ -374,6 +562,17 @@ class BaseSeasonDetector:
         """
         return self.season_patterns
 
+    @staticmethod
+    def clear_detection_cache() -> None:
+        """
+        Drop memoized detection results.
+
+        Long-running processes can call this to release memory; results are
+        recomputed on demand.
+        """
+        _season_candidates.cache_clear()
+        _has_quality_indicator.cache_clear()
+
     def _track_pattern_usage(self, pattern_desc: str, success: bool) -> None:
         """
         Track pattern usage for statistics.
@@ -382,11 +581,19 @@ class BaseSeasonDetector:
             pattern_desc: Pattern description
             success: Whether pattern matched successfully
         """
-        if pattern_desc not in self.stats['season_patterns_found']:
-            self.stats['season_patterns_found'][pattern_desc] = 0
+        # Adding the bool records the pattern even when it did not succeed
+        self.stats['season_patterns_found'][pattern_desc] += success
 
-        if success:
-            self.stats['season_patterns_found'][pattern_desc] += 1
+    def _track_confidence(self, confidence: float) -> None:
+        """
+        Fold a confidence score into the running mean.
+
+        Args:
+            confidence: Confidence score of a numeric-pattern match
+        """
+        stats = self.stats
+        stats['confidence_count'] += 1
+        stats['confidence_mean'] += (confidence - stats['confidence_mean']) / stats['confidence_count']
 
     def get_detection_stats(self) -> Dict[str, Any]:
         """
@@ -398,8 +605,5 @@ class BaseSeasonDetector:
         return {
             'patterns_found': dict(self.stats['season_patterns_found']),
             'total_patterns_used': len([k for k, v in self.stats['season_patterns_found'].items() if v > 0]),
-            'average_confidence': (
-                sum(self.stats['confidence_scores']) / len(self.stats['confidence_scores'])
-                if self.stats['confidence_scores'] else 0.0
-            )
+            'average_confidence': self.stats['confidence_mean']
         }
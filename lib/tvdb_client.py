@@ -8,7 +8,7 @@ Provides TVDB v4 API client with JWT authentication and caching.
 Features:
 - JWT authentication with automatic token management
 - 24-hour token caching for reduced API calls
-- Search functionality for TV series
+- Search functionality for TV series, with concurrent batch search
 - Integration with cache_manager for response caching
 - Integration with retry_utils for network resilience
 - Statistics tracking for cache hits/misses and retries
@@ -18,22 +18,63 @@ This module provides shared TVDB API access functionality for tools that need
 TV show metadata across media library tools.
 """
 
+import base64
+import hashlib
+import http.client
 import json
+import os
 import re
+import threading
 import time
-import urllib.error
 import urllib.parse
 import urllib.request
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Tuple
+
+# Use orjson for response parsing when installed; it decodes raw bytes and
+# raises a json.JSONDecodeError subclass, so the stdlib is a drop-in fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 # Import will be handled by build system
 # {{include retry_utils.py}}
 # {{include cache_manager.py}}
 
+# HTTP methods that can safely be sent twice
+_IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+# Characters stripped from show names before searching
+_SEARCH_NAME_RE = re.compile(r'[^\w\s-]')
+
+
+@lru_cache(maxsize=1024)
+def _clean_search_name(show_name: str) -> str:
+    """Strip punctuation from a show name for use as a search query."""
+    return _SEARCH_NAME_RE.sub('', show_name).strip()
+
 
 class TVDBClient:
     """Client for interacting with TVDB v4 API with caching and retry support."""
 
+    # Consecutive server/network failures that open the circuit breaker
+    BREAKER_THRESHOLD = 5
+    # Seconds the circuit stays open before a single probe request is allowed
+    BREAKER_COOLDOWN = 30.0
+    # Owner-only subdirectory of the cache directory, and the file in it,
+    # where the JWT token is shared between runs apart from the cached
+    # search results
+    TOKEN_DIR_NAME = 'tvdb_auth'
+    TOKEN_FILE_NAME = 'tvdb_token.json'
+    # Seconds to wait on connect and on each socket read, so a stale
+    # kept-alive connection cannot hang a request
+    REQUEST_TIMEOUT = 30.0
+    # Concurrent requests made by search_many
+    MAX_CONCURRENT_SEARCHES = 8
+
     def __init__(self, api_key: str, debug: bool = False, cache: Optional['CacheManager'] = None):
         """
         Initialize TVDB client with API key and optional cache.
@@ -46,6 +87,14 @@ class TVDBClient:
         self.api_key = api_key
         self.debug = debug
         self.base_url = "https://api4.thetvdb.com/v4"
+        base = urllib.parse.urlsplit(self.base_url)
+        self._host = base.netloc
+        self._base_path = base.path
+        # Kept-alive HTTPS connections, one per thread, opened lazily
+        self._local = threading.local()
+        self._connections = []
+        # Guards the connection list and circuit breaker across search threads
+        self._lock = threading.Lock()
         self.token = None
         self.token_expires = 0
         self.cache = cache
@@ -53,8 +102,172 @@ class TVDBClient:
         self.cache_misses = 0
         self.retry_attempts = 0
         self.retry_successes = 0
+        # Circuit breaker: 'closed' (normal), 'open' (skip requests) or
+        # 'half_open' (cooldown over, next request is a probe)
+        self._breaker_state = 'closed'
+        self._breaker_failures = 0
+        self._breaker_opened_at = 0.0
+        self.breaker_trips = 0
+
+    @property
+    def _connection(self) -> Optional[http.client.HTTPSConnection]:
+        """The calling thread's API connection, if open."""
+        return getattr(self._local, 'connection', None)
+
+    def _open_connection(self) -> http.client.HTTPSConnection:
+        """
+        Open an API connection for the calling thread.
+
+        Honors HTTPS_PROXY / https_proxy and the no_proxy bypass list as
+        urllib does, tunnelling through the proxy with CONNECT.
+        """
+        proxy = urllib.request.getproxies().get('https')
+        if proxy and not urllib.request.proxy_bypass(urllib.parse.urlsplit(f'//{self._host}').hostname):
+            proxy_url = urllib.parse.urlsplit(proxy if '://' in proxy else f'http://{proxy}')
+            connection = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port,
+                                                     timeout=self.REQUEST_TIMEOUT)
+            tunnel_headers = {}
+            if proxy_url.username:
+                credentials = (f"{urllib.parse.unquote(proxy_url.username)}:"
+                               f"{urllib.parse.unquote(proxy_url.password or '')}")
+                tunnel_headers['Proxy-Authorization'] = (
+                    'Basic ' + base64.b64encode(credentials.encode('utf-8')).decode('ascii'))
+            connection.set_tunnel(self._host, headers=tunnel_headers)
+        else:
+            connection = http.client.HTTPSConnection(self._host, timeout=self.REQUEST_TIMEOUT)
+        self._local.connection = connection
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def _drop_connection(self) -> None:
+        """Close the calling thread's API connection after an error."""
+        connection = self._connection
+        if connection is not None:
+            self._local.connection = None
+            self._release_connection(connection)
+
+    def _release_connection(self, connection: http.client.HTTPSConnection) -> None:
+        """Close an API connection and stop tracking it."""
+        connection.close()
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+
+    def _request(self, method: str, path: str, body: Optional[bytes] = None,
+                 headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+        """
+        Send a request to the TVDB API over a persistent connection.
+
+        Reusing one HTTPS connection saves a TCP and TLS handshake on every
+        call after the first. If the server has dropped an idle kept-alive
+        connection, the request is sent once more on a fresh one, but only
+        when that cannot repeat it: the method is idempotent, or the request
+        was never fully written.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the API base URL, including any query string
+            body: Request body
+            headers: Request headers
+
+        Returns:
+            Tuple of (status code, response body)
+
+        Raises:
+            OSError: On network failure
+            http.client.HTTPException: On protocol failure
+        """
+        while True:
+            connection = self._connection
+            reused = connection is not None
+            if not reused:
+                connection = self._open_connection()
+            written = False
+            try:
+                connection.request(method, self._base_path + path, body=body,
+                                   headers=headers or {})
+                written = True
+                response = connection.getresponse()
+                # Read the body fully so the connection can be reused
+                status, data = response.status, response.read()
+            except (OSError, http.client.HTTPException):
+                self._drop_connection()
+                if reused and (not written or method in _IDEMPOTENT_METHODS):
+                    continue
+                if not reused:
+                    self._record_failure()
+                raise
+
+            if status >= 500:
+                self._record_failure()
+            else:
+                self._record_success()
+            return status, data
+
+    def _circuit_allows_request(self) -> bool:
+        """
+        Check the circuit breaker before making a request.
+
+        While the circuit is open, requests are refused without touching the
+        network. Once the cooldown has passed, one probe request is let through.
+
+        Returns:
+            True if a request may be made, False if the circuit is open
+        """
+        if self._breaker_state == 'open':
+            if time.time() - self._breaker_opened_at < self.BREAKER_COOLDOWN:
+                if self.debug:
+                    print("TVDB circuit open, skipping request")
+                return False
+            self._breaker_state = 'half_open'
+        return True
+
+    def _record_failure(self) -> None:
+        """Count a server or network failure, opening the circuit if needed."""
+        with self._lock:
+            self._breaker_failures += 1
+            if self._breaker_state == 'half_open' or self._breaker_failures >= self.BREAKER_THRESHOLD:
+                if self._breaker_state != 'open':
+                    self.breaker_trips += 1
+                    if self.debug:
+                        print(f"TVDB circuit opened for {self.BREAKER_COOLDOWN:.0f}s "
+                              f"after {self._breaker_failures} consecutive failures")
+                self._breaker_state = 'open'
+                self._breaker_opened_at = time.time()
+
+    def _record_success(self) -> None:
+        """Reset the circuit breaker after a successful response."""
+        with self._lock:
+            self._breaker_failures = 0
+            self._breaker_state = 'closed'
+
+    def close(self) -> None:
+        """Close all persistent API connections."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local.connection = None
+
+    @retry_with_backoff(max_retries=3, base_delay=1.0, idempotent=False)
+    def _post_login(self) -> Tuple[int, bytes]:
+        """
+        Send the login request.
+
+        Network errors propagate so the retry decorator can tell whether the
+        request reached the server; only requests that cannot have are sent
+        again.
+
+        Returns:
+            Tuple of (status code, response body)
+        """
+        return self._request(
+            'POST', '/login',
+            body=json.dumps({"apikey": self.api_key}).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}
+        )
 
-    @retry_with_backoff(max_retries=3, base_delay=1.0)
     def login(self) -> bool:
         """
         Login to TVDB API and obtain JWT token.
@@ -66,31 +279,26 @@ class TVDBClient:
         Returns:
             True if login successful and token obtained, False otherwise
         """
-        login_url = f"{self.base_url}/login"
-        login_data = {"apikey": self.api_key}
+        if not self._circuit_allows_request():
+            return False
 
         try:
-            req = urllib.request.Request(
-                login_url,
-                data=json.dumps(login_data).encode('utf-8'),
-                headers={'Content-Type': 'application/json'}
-            )
+            status, body = self._post_login()
 
-            with urllib.request.urlopen(req) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    self.token = data['data']['token']
-                    # Token expires in 1 month, we'll cache for 24 hours to be safe
-                    self.token_expires = time.time() + (24 * 60 * 60)
-                    if self.debug:
-                        print("Successfully logged in to TVDB API")
-                    return True
-                else:
-                    if self.debug:
-                        print(f"Login failed with status {response.status}")
-                    return False
+            if status == 200:
+                data = _json_loads(body)
+                self.token = data['data']['token']
+                # Token expires in 1 month, we'll cache for 24 hours to be safe
+                self.token_expires = time.time() + (24 * 60 * 60)
+                if self.debug:
+                    print("Successfully logged in to TVDB API")
+                return True
+            else:
+                if self.debug:
+                    print(f"Login failed with status {status}")
+                return False
 
-        except urllib.error.URLError as e:
+        except (OSError, http.client.HTTPException) as e:
             if self.debug:
                 print(f"Login failed with network error: {e}")
             return False
@@ -104,15 +312,89 @@ class TVDBClient:
         Ensure we have a valid authentication token.
 
         Checks if current token is valid and not expired. If token is missing
-        or expired, attempts to login and obtain a new token.
+        or expired, reuses a token saved in the cache directory by an earlier
+        run, or logs in to obtain a new token and saves it for later runs.
 
         Returns:
             True if we have a valid token, False if authentication failed
         """
-        if not self.token or time.time() >= self.token_expires:
-            return self.login()
+        if self.token and time.time() < self.token_expires:
+            return True
+        if self._load_cached_token():
+            return True
+        if not self.login():
+            return False
+        self._save_cached_token()
         return True
 
+    def _api_key_fingerprint(self) -> str:
+        """Short hash tying a cached token to the API key that obtained it."""
+        return hashlib.sha256(self.api_key.encode('utf-8')).hexdigest()[:16]
+
+    def _token_file(self) -> Path:
+        """Path of the file holding the token shared between runs."""
+        return self.cache.cache_dir / self.TOKEN_DIR_NAME / self.TOKEN_FILE_NAME
+
+    def _load_cached_token(self) -> bool:
+        """
+        Load a still-valid token saved by a previous run.
+
+        Returns:
+            True if a usable token was loaded, False otherwise
+        """
+        if not self.cache:
+            return False
+        try:
+            with open(self._token_file(), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(entry, dict) or entry.get('api_key') != self._api_key_fingerprint():
+            return False
+        expires = entry.get('expires', 0)
+        # Leave a minute of slack so the token doesn't expire mid-run
+        if not entry.get('token') or expires <= time.time() + 60:
+            return False
+        self.token = entry['token']
+        self.token_expires = expires
+        if self.debug:
+            print("Using cached TVDB token")
+        return True
+
+    def _discard_token(self) -> None:
+        """Forget the current token, including any copy saved in the cache directory."""
+        self.token = None
+        self.token_expires = 0
+        if self.cache:
+            try:
+                os.remove(self._token_file())
+            except OSError:
+                pass
+
+    def _save_cached_token(self) -> None:
+        """Save the current token, readable only by the owner, so later runs can skip login."""
+        if not self.cache:
+            return
+        token_file = self._token_file()
+        temp_file = token_file.with_name(token_file.name + '.tmp')
+        try:
+            # The directory and file are created owner-only, and tightened in
+            # case they already existed with wider permissions
+            token_file.parent.mkdir(mode=0o700, exist_ok=True)
+            os.chmod(token_file.parent, 0o700)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if hasattr(os, 'fchmod'):
+                os.fchmod(fd, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'token': self.token,
+                    'expires': self.token_expires,
+                    'api_key': self._api_key_fingerprint()
+                }, f)
+            os.replace(temp_file, token_file)
+        except OSError:
+            pass  # Fail silently if we can't write the token, like the cache
+
     @retry_with_backoff(max_retries=3, base_delay=1.0)
     def search_show(self, show_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -145,54 +427,136 @@ class TVDBClient:
             else:
                 self.cache_misses += 1
 
+        if not self._circuit_allows_request():
+            return None
+
         if not self._ensure_authenticated():
             return None
 
-        # Clean up show name for search
-        clean_name = re.sub(r'[^\w\s-]', '', show_name).strip()
-        search_url = f"{self.base_url}/search"
-        params = {'query': clean_name, 'type': 'series'}
+        status, best_match = self._fetch_search(show_name)
+        if status == 401:
+            # Token rejected (e.g. a stale cached one); log in again next time
+            self._discard_token()
+        if best_match is not None and self.cache:
+            self.cache.set_show_search(show_name, best_match)
+        return best_match
+
+    def search_many(self, show_names: Iterable[str],
+                    max_workers: Optional[int] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Search for many TV shows, running uncached searches concurrently.
+
+        Cached names are answered without network access; the rest are
+        searched in parallel over one token, each worker thread keeping its
+        own connection. Duplicate names are searched once.
+
+        Args:
+            show_names: Names of the shows to search for
+            max_workers: Concurrent searches (default: MAX_CONCURRENT_SEARCHES)
+
+        Returns:
+            Dictionary mapping each show name to its search_show() result
 
+        Example:
+            >>> client = TVDBClient(api_key="your_key")
+            >>> results = client.search_many(["Breaking Bad", "The Wire"])
+            >>> results["The Wire"]['year']
+            '2002'
+        """
+        results = {}
+        pending = []
+        for show_name in dict.fromkeys(show_names):
+            cached_result = self.cache.get_show_search(show_name) if self.cache else None
+            if cached_result is not None:
+                self.cache_hits += 1
+                results[show_name] = cached_result
+            else:
+                if self.cache:
+                    self.cache_misses += 1
+                results[show_name] = None
+                pending.append(show_name)
+
+        # Authenticate once up front so the workers share one token
+        if not pending or not self._circuit_allows_request() or not self._ensure_authenticated():
+            return results
+
+        # Connections opened by the worker threads, which end with the batch
+        worker_connections = {}
+
+        def fetch(show_name: str) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+            try:
+                return self._fetch_search(show_name)
+            finally:
+                worker_connections[threading.get_ident()] = self._connection
+
+        workers = min(max_workers or self.MAX_CONCURRENT_SEARCHES, len(pending))
         try:
-            url_with_params = f"{search_url}?{urllib.parse.urlencode(params)}"
-            req = urllib.request.Request(
-                url_with_params,
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fetched = list(pool.map(fetch, pending))
+        finally:
+            for connection in worker_connections.values():
+                if connection is not None:
+                    self._release_connection(connection)
+
+        # Cache writes and token handling stay on the calling thread
+        token_rejected = False
+        for show_name, (status, best_match) in zip(pending, fetched):
+            token_rejected = token_rejected or status == 401
+            if best_match is not None:
+                results[show_name] = best_match
+                if self.cache:
+                    self.cache.set_show_search(show_name, best_match)
+        if token_rejected:
+            self._discard_token()
+        return results
+
+    def _fetch_search(self, show_name: str) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """
+        Run one search request against the API, without cache access.
+
+        Safe to call from several threads at once.
+
+        Args:
+            show_name: Name of the show to search for
+
+        Returns:
+            Tuple of (HTTP status or None on network error, best match or None)
+        """
+        params = {'query': _clean_search_name(show_name), 'type': 'series'}
+
+        try:
+            status, body = self._request(
+                'GET', f"/search?{urllib.parse.urlencode(params)}",
                 headers={'Authorization': f'Bearer {self.token}'}
             )
 
-            with urllib.request.urlopen(req) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    results = data.get('data', [])
-
-                    if results:
-                        # Return first result with year info
-                        best_match = results[0]
-
-                        # Cache the result if cache is available
-                        if self.cache:
-                            self.cache.set_show_search(show_name, best_match)
-
-                        if self.debug:
-                            print(f"Found show: {best_match.get('name')} ({best_match.get('year')})")
-                        return best_match
-                    else:
-                        if self.debug:
-                            print(f"No results found for '{show_name}'")
-                        return None
+            if status == 200:
+                data = _json_loads(body)
+                results = data.get('data', [])
+
+                if results:
+                    # Return first result with year info
+                    best_match = results[0]
+                    if self.debug:
+                        print(f"Found show: {best_match.get('name')} ({best_match.get('year')})")
+                    return status, best_match
                 else:
                     if self.debug:
-                        print(f"Search failed with status {response.status}")
-                    return None
+                        print(f"No results found for '{show_name}'")
+                    return status, None
+            else:
+                if self.debug:
+                    print(f"Search failed with status {status}")
+                return status, None
 
-        except urllib.error.URLError as e:
+        except (OSError, http.client.HTTPException) as e:
             if self.debug:
                 print(f"Search failed with network error: {e}")
-            return None
+            return None, None
         except (json.JSONDecodeError, KeyError) as e:
             if self.debug:
                 print(f"Search failed with data error: {e}")
-            return None
+            return status, None
 
     def get_statistics(self) -> Dict[str, int]:
         """
@@ -204,10 +568,14 @@ class TVDBClient:
             - cache_misses: Number of cache misses requiring API calls
             - retry_attempts: Total number of retry attempts
             - retry_successes: Number of successful retries
+            - breaker_trips: Number of times the circuit breaker opened
+            - consecutive_failures: Current run of server/network failures
         """
         return {
             'cache_hits': self.cache_hits,
             'cache_misses': self.cache_misses,
             'retry_attempts': self.retry_attempts,
-            'retry_successes': self.retry_successes
+            'retry_successes': self.retry_successes,
+            'breaker_trips': self.breaker_trips,
+            'consecutive_failures': self._breaker_failures
         }
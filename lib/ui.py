@@ -7,32 +7,62 @@ This module contains user interface functions including:
 - Banner display and application branding
 - Size formatting for human-readable output  
 - User confirmation prompts
+- Buffered stdout for bulk output
 
 This is part of the modular library structure that enables selective inclusion
 in built tools while maintaining the self-contained principle.
 """
 
+import io
+import os
 import sys
 import time
-import shutil
-import os
 from pathlib import Path
-from typing import Optional, List, Dict, Set, Callable, Any
+from typing import Optional, List, Callable, Any
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 
 # Import dependencies from core module
 try:
     from core import is_non_interactive, should_use_emojis
 except ImportError:
     # Fallback for when core module is not available
-    # This happens when modules are injected together during build
-    def is_non_interactive():
-        """Fallback implementation - will be overridden by injected core module"""
-        return not sys.stdin.isatty()
-    
-    def should_use_emojis():
-        """Fallback implementation - will be overridden by injected core module"""
-        return sys.platform != "win32" and not is_non_interactive()
+    # This happens when modules are injected together during build; keep the
+    # injected (memoized) core versions if they were defined earlier. The
+    # fallbacks are memoized too, as display helpers call them per message
+    if "is_non_interactive" not in globals():
+        @lru_cache(maxsize=1)
+        def is_non_interactive():
+            """Fallback implementation - will be overridden by injected core module"""
+            return not sys.stdin.isatty()
+
+    if "should_use_emojis" not in globals():
+        @lru_cache(maxsize=1)
+        def should_use_emojis():
+            """Fallback implementation - will be overridden by injected core module"""
+            return sys.platform != "win32" and not is_non_interactive()
+
+
+# Standardized ASCII art shown by display_banner
+_BANNER_ART = (
+    "┏┳┓┏━╸╺┳┓╻┏━┓╻  ╻┏┓ ┏━┓┏━┓┏━┓╻ ╻╺┳╸┏━┓┏━┓╻  ┏━┓\n"
+    "┃┃┃┣╸  ┃┃┃┣━┫┃  ┃┣┻┓┣┳┛┣━┫┣┳┛┗┳┛ ┃ ┃ ┃┃ ┃┃  ┗━┓\n"
+    "╹ ╹┗━╸╺┻┛╹╹ ╹┗━╸╹┗━┛╹┗╸╹ ╹╹┗╸ ╹  ╹ ┗━┛┗━┛┗━╸┗━┛\n"
+)
+
+
+def clear_ui_cache() -> None:
+    """
+    Clear memoized environment detection used by the display functions.
+
+    Emoji support and interactivity are detected once per process; tests that
+    change the environment call this to force re-detection.
+    """
+    for detect in (is_non_interactive, should_use_emojis):
+        cache_clear = getattr(detect, "cache_clear", None)
+        if cache_clear is not None:
+            cache_clear()
 
 
 def display_banner(
@@ -57,17 +87,24 @@ def display_banner(
         return
 
     try:
-        # Display standardized ASCII art
-        print("┏┳┓┏━╸╺┳┓╻┏━┓╻  ╻┏┓ ┏━┓┏━┓┏━┓╻ ╻╺┳╸┏━┓┏━┓╻  ┏━┓")
-        print("┃┃┃┣╸  ┃┃┃┣━┫┃  ┃┣┻┓┣┳┛┣━┫┣┳┛┗┳┛ ┃ ┃ ┃┃ ┃┃  ┗━┓")
-        print("╹ ╹┗━╸╺┻┛╹╹ ╹┗━╸╹┗━┛╹┗╸╹ ╹╹┗╸ ╹  ╹ ┗━┛┗━┛┗━╸┗━┛")
-        print(f"{script_name} v{version}: {description}")
-        print()  # Blank line for separation
+        # Standardized ASCII art, tool line and a blank separator line
+        sys.stdout.write(f"{_BANNER_ART}{script_name} v{version}: {description}\n\n")
     except Exception:
         # Banner display errors should not prevent script execution
         pass
 
 
+# (divisor, unit) per power of 1024, indexed by bit length // 10
+_SIZE_TABLE = (
+    (1, "B"),
+    (1 << 10, "K"),
+    (1 << 20, "M"),
+    (1 << 30, "G"),
+    (1 << 40, "T"),
+    (1 << 50, "P"),
+)
+
+
 def format_size(size_bytes: int) -> str:
     """
     Format size in bytes to human readable format.
@@ -78,14 +115,17 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Human readable size string
     """
-    for unit in ["B", "K", "M", "G", "T"]:
-        if size_bytes < 1024.0:
-            if unit == "B":
-                return f"{size_bytes:.0f}{unit}"
-            else:
-                return f"{size_bytes:.1f}{unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f}P"
+    if size_bytes < 1024:
+        return f"{size_bytes:.0f}B"
+
+    # The bit length gives floor(log2(size)), so the unit index follows
+    # directly instead of from repeated division
+    divisor, unit = _SIZE_TABLE[min(len(_SIZE_TABLE) - 1, (int(size_bytes).bit_length() - 1) // 10)]
+    return f"{size_bytes / divisor:.1f}{unit}"
+
+
+# Responses accepted as confirmation by confirm_action
+_CONFIRM_YES = frozenset(("y", "yes"))
 
 
 def confirm_action(message: str, skip_confirmation: bool = False) -> bool:
@@ -104,7 +144,7 @@ def confirm_action(message: str, skip_confirmation: bool = False) -> bool:
 
     try:
         response = input(f"{message} (y/N): ").strip().lower()
-        return response in ["y", "yes"]
+        return response in _CONFIRM_YES
     except (EOFError, KeyboardInterrupt):
         print("\nOperation cancelled.")
         return False
@@ -156,17 +196,21 @@ def display_item_list(items, title: str = None, numbered: bool = False,
             print(f"{title}: None found")
         return
     
+    # Build all lines first and write them at once
+    lines = []
+
     # Display title with optional count
     if title:
         count_text = f" ({len(items)})" if show_count else ""
-        print(f"{title}{count_text}:")
+        lines.append(f"{title}{count_text}:")
     
-    # Display items
-    for i, item in enumerate(items, 1):
-        if numbered:
-            print(f"{indent}{i}. {item}")
-        else:
-            print(f"{indent}- {item}")
+    # Display items; the numbering choice is made once, not per item
+    if numbered:
+        lines.extend(f"{indent}{i}. {item}" for i, item in enumerate(items, 1))
+    else:
+        lines.extend(f"{indent}- {item}" for item in items)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_summary_list(summary_data: dict, title: str = None) -> None:
@@ -189,14 +233,19 @@ def display_summary_list(summary_data: dict, title: str = None) -> None:
         #   Files skipped: 3
         #   Errors encountered: 1
     """
+    lines = []
     if title:
-        print(f"{title}:")
+        lines.append(f"{title}:")
     
-    # Find the longest key for alignment
-    max_key_length = max(len(str(key)) for key in summary_data.keys()) if summary_data else 0
+    # Stringify keys once, then find the longest for alignment
+    str_keys = [str(key) for key in summary_data]
+    max_key_length = max(map(len, str_keys), default=0)
     
-    for key, value in summary_data.items():
-        print(f"  {str(key).ljust(max_key_length)}: {value}")
+    for key, value in zip(str_keys, summary_data.values()):
+        lines.append(f"  {key:<{max_key_length}}: {value}")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_progress_item(current: int, total: int, item_name: str, 
@@ -213,8 +262,69 @@ def display_progress_item(current: int, total: int, item_name: str,
     Example:
         display_progress_item(3, 10, 'movie.mp4')
         # Output: [3/10] Processing: movie.mp4
+
+    Wrap long loops in BufferedOutput to batch the writes.
+    """
+    sys.stdout.write(f"[{current}/{total}] {prefix}: {item_name}\n")
+
+
+class BufferedOutput:
+    """
+    Context manager that buffers stdout for bulk UI output.
+
+    While active, output written to sys.stdout is collected in memory and
+    written to the real stream in large chunks: whenever min_size characters
+    have accumulated, on an explicit flush() (e.g. from a progress bar), and
+    when the block exits. There is no timed flush.
+
+    Example:
+        with BufferedOutput():
+            for i, name in enumerate(files, 1):
+                display_progress_item(i, len(files), name)
     """
-    print(f"[{current}/{total}] {prefix}: {item_name}")
+
+    def __init__(self, min_size: int = 64 * 1024):
+        """
+        Initialize buffered output.
+
+        Args:
+            min_size: Buffered characters that trigger an early write (default: 64K)
+        """
+        self.min_size = min_size
+        self._stream = None
+        self._buffer = io.StringIO()
+
+    def __enter__(self):
+        self._stream = sys.stdout
+        sys.stdout = self
+        return self
+
+    def __exit__(self, *args):
+        sys.stdout = self._stream
+        self._write_buffer()
+
+    def __getattr__(self, name):
+        # Delegate everything else (encoding, isatty, ...) to the real stream
+        return getattr(self._stream, name)
+
+    def write(self, text: str) -> int:
+        """Buffer text, writing it out once min_size is reached."""
+        written = self._buffer.write(text)
+        if self._buffer.tell() >= self.min_size:
+            self._write_buffer()
+        return written
+
+    def flush(self) -> None:
+        """Write buffered text and flush the real stream."""
+        self._write_buffer()
+        self._stream.flush()
+
+    def _write_buffer(self) -> None:
+        """Move buffered text to the real stream."""
+        if self._buffer.tell():
+            self._stream.write(self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
 
 
 def display_stats_table(stats: dict, title: str = None, 
@@ -237,15 +347,19 @@ def display_stats_table(stats: dict, title: str = None,
     if not stats:
         return
     
+    lines = []
     if title:
-        print(f"\n{title}:")
+        lines.append(f"\n{title}:")
     
-    # Find the longest key for alignment
-    max_key_length = max(len(str(key)) for key in stats.keys())
+    # Stringify keys once, then find the longest for alignment
+    str_keys = [str(key) for key in stats]
+    max_key_length = max(map(len, str_keys))
     
-    for key, value in stats.items():
+    for key, value in zip(str_keys, stats.values()):
         formatted_value = value_formatter(value) if value_formatter else str(value)
-        print(f"  {str(key).ljust(max_key_length)}: {formatted_value}")
+        lines.append(f"  {key:<{max_key_length}}: {formatted_value}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 @dataclass
@@ -318,29 +432,30 @@ def display_results_table(data: list, headers: list, title: str = None,
 
     # Sort data if requested
     if sort_by is not None and 0 <= sort_by < len(headers):
-        data = sorted(data, key=lambda row: row[sort_by] if sort_by < len(row) else '', reverse=reverse)
-
-    # Apply formatters to data
+        # itemgetter keys the common case in C; rows too short for the sort
+        # column fall back to sorting as empty
+        try:
+            data = sorted(data, key=itemgetter(sort_by), reverse=reverse)
+        except IndexError:
+            data = sorted(data, key=lambda row: row[sort_by] if sort_by < len(row) else '', reverse=reverse)
+
+    # Apply formatters to data, widening each column to its header and
+    # widest cell in the same pass; each cell is stringified once
+    formatters = [config.formatter or str for config in column_config]
+    col_widths = [len(header) for header in headers]
+    column_count = len(col_widths)
     formatted_data = []
     for row in data:
-        formatted_row = []
-        for i, cell in enumerate(row):
-            if i < len(column_config) and column_config[i].formatter:
-                formatted_row.append(column_config[i].formatter(cell))
-            else:
-                formatted_row.append(str(cell))
+        formatted_row = [formatters[i](cell) if i < len(formatters) else str(cell)
+                         for i, cell in enumerate(row)]
+        for i, cell in enumerate(formatted_row[:column_count]):
+            if len(cell) > col_widths[i]:
+                col_widths[i] = len(cell)
         formatted_data.append(formatted_row)
 
-    # Calculate column widths
-    col_widths = []
-    for i, header in enumerate(headers):
-        # Start with header width
-        max_col_width = len(header)
-
-        # Check data column widths
-        for row in formatted_data:
-            if i < len(row):
-                max_col_width = max(max_col_width, len(row[i]))
+    # Clamp column widths once, after the data pass
+    for i in range(column_count):
+        max_col_width = col_widths[i]
 
         # Apply column-specific max width if set
         if i < len(column_config) and column_config[i].max_width:
@@ -349,7 +464,7 @@ def display_results_table(data: list, headers: list, title: str = None,
             # Apply global max width
             max_col_width = min(max_col_width, max_width // len(headers))
 
-        col_widths.append(max_col_width)
+        col_widths[i] = max_col_width
 
     # Choose border characters
     if border_style == 'unicode':
@@ -371,49 +486,55 @@ def display_results_table(data: list, headers: list, title: str = None,
         bot_left = bot_mid = bot_right = ""
         horiz = "-"
 
-    def align_cell(cell: str, width: int, alignment: str) -> str:
-        """Align cell content according to specified alignment."""
-        if len(cell) > width:
-            cell = cell[:width-3] + "..."
-        if alignment == 'right':
-            return cell.rjust(width)
-        elif alignment == 'center':
-            return cell.center(width)
-        else:  # left
-            return cell.ljust(width)
+    # Per-column (width, alignment), resolved once for all rows
+    columns = [(col_widths[i], column_config[i].align) for i in range(len(headers))]
+
+    # Row template with each column's padding built in. Centered cells are
+    # padded by str.center beforehand, since it places odd padding
+    # differently from the '^' format spec
+    row_template = "  " + sep.join(
+        "{}" if alignment == 'center' else f"{{:{'>' if alignment == 'right' else '<'}{width}}}"
+        for width, alignment in columns
+    )
+
+    def truncate(cell: str, width: int) -> str:
+        """Shorten cell content that does not fit its column."""
+        return cell if len(cell) <= width else cell[:width-3] + "..."
+
+    def format_row(cells: list) -> str:
+        """Fill the row template with one cell per column."""
+        return row_template.format(*[
+            truncate(cell, width).center(width) if alignment == 'center' else truncate(cell, width)
+            for cell, (width, alignment) in zip(cells, columns)
+        ])
+
+    # Collect every output line and write the table in one call
+    lines = []
 
     # Display title
     if title:
-        print(f"\n{title}:")
+        lines.append(f"\n{title}:")
 
-    # Build and print header
-    header_cells = []
-    for i, header in enumerate(headers):
-        alignment = column_config[i].align if i < len(column_config) else 'left'
-        header_cells.append(align_cell(header, col_widths[i], alignment))
+    # Build header
+    header_row = format_row(headers)
+    lines.append(header_row)
 
-    header_row = "  " + sep.join(header_cells)
-    print(header_row)
-
-    # Print separator
+    # Separator
     if border_style == 'unicode':
         separator = "  " + mid_left + horiz * col_widths[0]
         for i in range(1, len(col_widths)):
             separator += mid_mid + horiz * col_widths[i]
         separator += mid_right
-        print(separator)
+        lines.append(separator)
     else:
-        print("  " + horiz * (len(header_row) - 2))
+        lines.append("  " + horiz * (len(header_row) - 2))
 
-    # Print data rows
+    # Data rows, padded with empty cells when short
+    column_count = len(columns)
     for row in formatted_data:
-        row_cells = []
-        for i in range(len(headers)):
-            cell = row[i] if i < len(row) else ""
-            alignment = column_config[i].align if i < len(column_config) else 'left'
-            row_cells.append(align_cell(cell, col_widths[i], alignment))
-
-        print("  " + sep.join(row_cells))
+        if len(row) < column_count:
+            row = row + [""] * (column_count - len(row))
+        lines.append(format_row(row))
 
     # Show totals if requested
     if show_totals and data:
@@ -438,23 +559,40 @@ def display_results_table(data: list, headers: list, title: str = None,
                 totals.append("")
 
         if has_total:
-            # Print separator before totals
+            # Separator before totals
             if border_style != 'minimal':
-                print("  " + horiz * (len(header_row) - 2))
+                lines.append("  " + horiz * (len(header_row) - 2))
 
-            # Print totals row
+            # Totals row
             total_cells = []
             for i in range(len(headers)):
                 if i == 0 and not totals[0]:
                     cell = "TOTAL"
                 else:
                     cell = totals[i] if i < len(totals) else ""
-                alignment = column_config[i].align if i < len(column_config) else 'left'
-                total_cells.append(align_cell(cell, col_widths[i], alignment))
+                total_cells.append(cell)
+
+            lines.append(format_row(total_cells))
+
+    lines.append("")  # Blank line after table
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
-            print("  " + sep.join(total_cells))
+def _format_minutes(seconds: float) -> str:
+    """
+    Format a time of at least a minute as "Xm Ys", or "Xh Ym" from an hour.
+
+    Args:
+        seconds: Time in seconds (60 or more)
 
-    print()  # Blank line after table
+    Returns:
+        Formatted time string
+    """
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m {secs}s"
 
 
 class ProgressBar:
@@ -488,17 +626,39 @@ class ProgressBar:
             unit: Unit name for rate display (default: "items")
             show_rate: Whether to show processing rate (default: True)
         """
+        self.width = width
+        self.show_rate = show_rate
+        self.is_tty = sys.stdout.isatty() and not is_non_interactive()
+        # Clear the line with the ANSI erase sequence where the terminal
+        # understands it, otherwise overwrite it with spaces
+        self.use_ansi = sys.platform != "win32" and os.environ.get("TERM", "") != "dumb"
+        self.update_interval_ns = 100_000_000  # Update display every 0.1 seconds minimum
+        # Every possible bar, indexed by filled cell count
+        self._bars = [("█" * filled + "░" * (width - filled)) for filled in range(width + 1)]
+        self.reset(total, desc, unit)
+
+    def reset(self, total: int, desc: str = "", unit: str = "items") -> None:
+        """
+        Restart the progress bar for a new run, keeping its width and
+        terminal settings.
+
+        Args:
+            total: Total number of items to process
+            desc: Description to display before progress bar
+            unit: Unit name for rate display (default: "items")
+        """
         self.total = total
         self.desc = desc
-        self.width = width
         self.unit = unit
-        self.show_rate = show_rate
         self.current = 0
-        self.start_time = time.time()
-        self.last_update_time = self.start_time
+        # Monotonic integer timestamps; converted to seconds only for display
+        self.start_ns = time.monotonic_ns()
+        self.last_update_ns = self.start_ns
         self.last_print_length = 0
-        self.is_tty = sys.stdout.isatty() and not is_non_interactive()
-        self.update_interval = 0.1  # Update display every 0.1 seconds minimum
+        # Last rendered (filled cells, tenths of a percent), to skip unchanged frames
+        self._last_frame_key = None
+        # Last milestone printed in non-TTY mode
+        self._last_milestone = -1
         self.completed = False
 
     def update(self, increment: int = 1) -> None:
@@ -509,13 +669,13 @@ class ProgressBar:
             increment: Number of items to add to progress (default: 1)
         """
         self.current = min(self.current + increment, self.total)
-        current_time = time.time()
+        current_ns = time.monotonic_ns()
 
         # Only update display if enough time has passed or we're complete
-        if (current_time - self.last_update_time >= self.update_interval or
+        if (current_ns - self.last_update_ns >= self.update_interval_ns or
             self.current >= self.total):
             self._display()
-            self.last_update_time = current_time
+            self.last_update_ns = current_ns
 
     def _display(self) -> None:
         """Display current progress state."""
@@ -523,13 +683,21 @@ class ProgressBar:
             return
 
         # Calculate metrics
-        elapsed = time.time() - self.start_time
+        elapsed = (time.monotonic_ns() - self.start_ns) / 1e9
         percentage = (self.current / self.total) * 100
 
         # Build progress bar
         if self.is_tty:
             filled = int(self.width * self.current / self.total)
-            bar = "█" * filled + "░" * (self.width - filled)
+
+            # Nothing visible changed since the last frame; the final frame
+            # is always drawn
+            frame_key = (filled, self.current * 1000 // self.total)
+            if frame_key == self._last_frame_key and self.current < self.total:
+                return
+            self._last_frame_key = frame_key
+
+            bar = self._bars[filled]
 
             # Calculate ETA
             if self.current > 0 and elapsed > 0:
@@ -558,22 +726,25 @@ class ProgressBar:
             else:
                 status = f"{self.desc}: [{bar}] {self.current}/{self.total} ({percentage:.1f}%)"
 
-            # Clear previous line and print new status
-            print(f"\r{' ' * self.last_print_length}\r{status}", end="", flush=True)
-            self.last_print_length = len(status)
-
-            # Print newline when complete
+            # Clear previous line and write the new status as one frame,
+            # ending the line when complete
+            if self.use_ansi:
+                frame = f"\r\x1b[2K{status}"
+            else:
+                frame = f"\r{' ' * self.last_print_length}\r{status}"
+                self.last_print_length = len(status)
             if self.current >= self.total and not self.completed:
-                print()
+                frame += "\n"
                 self.completed = True
+
+            stdout = sys.stdout
+            stdout.write(frame)
+            stdout.flush()
         else:
             # Non-TTY mode: only print at milestones (0%, 25%, 50%, 75%, 100%)
             milestones = [0, 25, 50, 75, 100]
             current_milestone = int(percentage / 25) * 25
 
-            if not hasattr(self, '_last_milestone'):
-                self._last_milestone = -1
-
             if current_milestone > self._last_milestone and current_milestone in milestones:
                 prefix = f"{self.desc}: " if self.desc else ""
                 print(f"{prefix}Progress: {self.current}/{self.total} ({percentage:.1f}%)")
@@ -591,14 +762,7 @@ class ProgressBar:
         """
         if seconds < 60:
             return f"{int(seconds)}s"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds / 3600)
-            minutes = int((seconds % 3600) / 60)
-            return f"{hours}h {minutes}m"
+        return _format_minutes(seconds)
 
     def __enter__(self):
         """Context manager entry."""
@@ -613,6 +777,29 @@ class ProgressBar:
                 print()
 
 
+@dataclass
+class PhaseState:
+    """
+    Progress state of a single phase in a PhaseProgressTracker.
+
+    Attributes:
+        name: Phase name
+        status: Phase status ('pending', 'in-progress', 'completed', 'failed')
+        total: Total number of items in the phase
+        current: Number of items processed so far
+        start_time: Time the phase started (None until started)
+        end_time: Time the phase ended (None until completed)
+        progress_bar: Progress bar for the phase, if it has items
+    """
+    name: str
+    status: str = 'pending'
+    total: int = 0
+    current: int = 0
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    progress_bar: Optional[ProgressBar] = None
+
+
 class PhaseProgressTracker:
     """
     Multi-phase operation tracking with individual progress bars.
@@ -647,21 +834,23 @@ class PhaseProgressTracker:
             phase_names: List of phase names in order
         """
         self.phase_names = phase_names
-        self.phases: Dict[int, Dict] = {}
+        # One state per phase, indexed by phase index
+        self.phases: List[PhaseState] = [PhaseState(name) for name in phase_names]
         self.current_phase_index: Optional[int] = None
         self.is_tty = sys.stdout.isatty() and not is_non_interactive()
-
-        # Initialize phase data
-        for i in range(len(phase_names)):
-            self.phases[i] = {
-                'name': phase_names[i],
-                'status': 'pending',  # pending, in-progress, completed, failed
-                'total': 0,
-                'current': 0,
-                'start_time': None,
-                'end_time': None,
-                'progress_bar': None
-            }
+        # One progress bar, reset for each phase that has items, and the
+        # phase currently showing it
+        self._bar = ProgressBar(total=0, desc="  Progress", width=40, unit="items")
+        self._bar_phase: Optional[PhaseState] = None
+
+        # Summary symbol per phase status, resolved once for the environment
+        plain = is_non_interactive()
+        self._status_symbols = {
+            'pending': '[ ]',
+            'in-progress': '[~]',
+            'completed': '[x]' if plain else '[✓]',
+            'failed': '[!]' if plain else '[✗]'
+        }
 
     def start_phase(self, phase_index: int, total_items: int = 0) -> None:
         """
@@ -671,25 +860,25 @@ class PhaseProgressTracker:
             phase_index: Index of the phase to start (0-based)
             total_items: Total number of items for this phase
         """
-        if phase_index not in self.phases:
+        if not 0 <= phase_index < len(self.phases):
             return
 
         self.current_phase_index = phase_index
         phase = self.phases[phase_index]
-        phase['status'] = 'in-progress'
-        phase['total'] = total_items
-        phase['current'] = 0
-        phase['start_time'] = time.time()
+        phase.status = 'in-progress'
+        phase.total = total_items
+        phase.current = 0
+        phase.start_time = time.time()
 
         # Display phase start
-        print(f"\n{phase['name']}")
+        print(f"\n{phase.name}")
         if total_items > 0:
-            phase['progress_bar'] = ProgressBar(
-                total=total_items,
-                desc="  Progress",
-                width=40,
-                unit="items"
-            )
+            # The phase that showed the bar before gives it up
+            if self._bar_phase is not None:
+                self._bar_phase.progress_bar = None
+            self._bar.reset(total_items, "  Progress", "items")
+            phase.progress_bar = self._bar
+            self._bar_phase = phase
 
     def update_phase(self, phase_index: int, increment: int = 1) -> None:
         """
@@ -699,17 +888,17 @@ class PhaseProgressTracker:
             phase_index: Index of the phase to update
             increment: Number of items to add to progress
         """
-        if phase_index not in self.phases:
+        if not 0 <= phase_index < len(self.phases):
             return
 
         phase = self.phases[phase_index]
-        if phase['status'] != 'in-progress':
+        if phase.status != 'in-progress':
             return
 
-        phase['current'] = min(phase['current'] + increment, phase['total'])
+        phase.current = min(phase.current + increment, phase.total)
 
-        if phase['progress_bar']:
-            phase['progress_bar'].update(increment)
+        if phase.progress_bar:
+            phase.progress_bar.update(increment)
 
     def complete_phase(self, phase_index: int, status: str = 'completed') -> None:
         """
@@ -719,23 +908,23 @@ class PhaseProgressTracker:
             phase_index: Index of the phase to complete
             status: Final status ('completed' or 'failed')
         """
-        if phase_index not in self.phases:
+        if not 0 <= phase_index < len(self.phases):
             return
 
         phase = self.phases[phase_index]
-        phase['status'] = status
-        phase['end_time'] = time.time()
+        phase.status = status
+        phase.end_time = time.time()
 
         # Ensure progress bar is complete
-        if phase['progress_bar'] and phase['current'] < phase['total']:
-            phase['progress_bar'].current = phase['total']
-            phase['progress_bar']._display()
-            if phase['progress_bar'].is_tty:
+        if phase.progress_bar and phase.current < phase.total:
+            phase.progress_bar.current = phase.total
+            phase.progress_bar._display()
+            if phase.progress_bar.is_tty:
                 print()
 
         # Display phase completion
-        if phase['start_time']:
-            duration = phase['end_time'] - phase['start_time']
+        if phase.start_time:
+            duration = phase.end_time - phase.start_time
             duration_str = self._format_duration(duration)
             status_text = "Complete" if status == 'completed' else "FAILED"
             print(f"  {status_text} - Duration: {duration_str}\n")
@@ -754,35 +943,29 @@ class PhaseProgressTracker:
 
     def display_summary(self) -> None:
         """Display summary of all phases."""
-        print("\n" + "=" * 60)
-        print("PHASE SUMMARY")
-        print("=" * 60)
+        lines = ["", "=" * 60, "PHASE SUMMARY", "=" * 60]
 
         total_duration = 0
-        for i in range(len(self.phase_names)):
-            phase = self.phases[i]
-            status_symbol = {
-                'pending': '[ ]',
-                'in-progress': '[~]',
-                'completed': '[✓]' if not is_non_interactive() else '[x]',
-                'failed': '[✗]' if not is_non_interactive() else '[!]'
-            }.get(phase['status'], '[ ]')
+        for phase in self.phases:
+            status_symbol = self._status_symbols.get(phase.status, '[ ]')
 
             duration_str = ""
-            if phase['start_time'] and phase['end_time']:
-                duration = phase['end_time'] - phase['start_time']
+            if phase.start_time and phase.end_time:
+                duration = phase.end_time - phase.start_time
                 duration_str = f" - {self._format_duration(duration)}"
                 total_duration += duration
 
             progress_str = ""
-            if phase['total'] > 0:
-                progress_str = f" ({phase['current']}/{phase['total']} items)"
+            if phase.total > 0:
+                progress_str = f" ({phase.current}/{phase.total} items)"
 
-            print(f"{status_symbol} {phase['name']}{progress_str}{duration_str}")
+            lines.append(f"{status_symbol} {phase.name}{progress_str}{duration_str}")
 
         if total_duration > 0:
-            print(f"\nTotal Duration: {self._format_duration(total_duration)}")
-        print("=" * 60 + "\n")
+            lines.append(f"\nTotal Duration: {self._format_duration(total_duration)}")
+        lines.append("=" * 60 + "\n")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def get_overall_progress(self) -> float:
         """
@@ -791,7 +974,7 @@ class PhaseProgressTracker:
         Returns:
             Overall progress percentage (0-100)
         """
-        completed_phases = sum(1 for p in self.phases.values() if p['status'] == 'completed')
+        completed_phases = sum(1 for p in self.phases if p.status == 'completed')
         return (completed_phases / len(self.phase_names)) * 100 if self.phase_names else 0
 
     def _format_duration(self, seconds: float) -> str:
@@ -808,14 +991,7 @@ class PhaseProgressTracker:
             return f"{int(seconds * 1000)}ms"
         elif seconds < 60:
             return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds / 3600)
-            minutes = int((seconds % 3600) / 60)
-            return f"{hours}h {minutes}m"
+        return _format_minutes(seconds)
 
 
 def display_directory_tree(root_path: str, max_depth: int = 3,
@@ -864,51 +1040,51 @@ def display_directory_tree(root_path: str, max_depth: int = 3,
         ELBOW = "`-- "
         BLANK = "    "
 
-    # Compile highlight patterns if provided
-    highlight_set: Set[str] = set()
-    if highlight_patterns:
-        for pattern in highlight_patterns:
-            highlight_set.add(pattern.lower())
+    # Highlight patterns reduced once to lowercase substrings (wildcards dropped)
+    highlight_needles = tuple(pattern.lower().replace("*", "") for pattern in highlight_patterns or ())
 
     # Track statistics
     total_size = 0
     file_count = 0
     dir_count = 0
 
-    def should_highlight(path: Path) -> bool:
-        """Check if path matches any highlight patterns."""
-        if not highlight_patterns:
+    def should_highlight(name: str) -> bool:
+        """Check if an entry name matches any highlight patterns."""
+        if not highlight_needles:
             return False
-        path_str = path.name.lower()
-        for pattern in highlight_patterns:
-            pattern_lower = pattern.lower().replace("*", "")
-            if pattern_lower in path_str:
-                return True
-        return False
+        name = name.lower()
+        return any(needle in name for needle in highlight_needles)
 
-    def get_size(path: Path) -> int:
+    def get_size(entry: os.DirEntry) -> int:
         """Get size of file or directory."""
         try:
-            if path.is_file():
-                return path.stat().st_size
-            elif path.is_dir():
-                # For directories, sum all file sizes
+            if entry.is_file():
+                return entry.stat().st_size
+            elif entry.is_dir():
+                # For directories, sum all file sizes; subdirectories are
+                # walked with scandir on plain string paths, without
+                # following directory symlinks
                 total = 0
-                try:
-                    for item in path.rglob('*'):
-                        if item.is_file():
-                            try:
-                                total += item.stat().st_size
-                            except (OSError, PermissionError):
-                                pass
-                except (OSError, PermissionError):
-                    pass
+                pending = [entry.path]
+                while pending:
+                    try:
+                        with os.scandir(pending.pop()) as it:
+                            for item in it:
+                                try:
+                                    if item.is_file():
+                                        total += item.stat().st_size
+                                    elif item.is_dir(follow_symlinks=False):
+                                        pending.append(item.path)
+                                except (OSError, PermissionError):
+                                    pass
+                    except (OSError, PermissionError):
+                        pass
                 return total
         except (OSError, PermissionError):
             return 0
         return 0
 
-    def format_entry(path: Path, is_last: bool, prefix: str, depth: int) -> str:
+    def format_entry(entry: os.DirEntry, is_last: bool, prefix: str, depth: int) -> str:
         """Format a single tree entry."""
         nonlocal total_size, file_count, dir_count
 
@@ -916,63 +1092,69 @@ def display_directory_tree(root_path: str, max_depth: int = 3,
         connector = ELBOW if is_last else TEE
 
         # Get name and size
-        name = path.name
-        if path.is_dir():
+        name = entry.name
+        if entry.is_dir():
             name += "/"
             dir_count += 1
         else:
             file_count += 1
 
         # Check for highlighting
-        highlighted = should_highlight(path)
+        highlighted = should_highlight(entry.name)
         if highlighted and use_unicode:
             name = f"→ {name}"
 
         # Add size if requested
         size_str = ""
         if show_sizes:
-            size = get_size(path)
+            size = get_size(entry)
             total_size += size
             if size > 0:
                 size_str = f" ({format_size(size)})"
 
         return f"{prefix}{connector}{name}{size_str}"
 
-    def walk_tree(path: Path, prefix: str = "", depth: int = 0):
+    # Output lines, written in one go once the walk is done
+    lines = []
+
+    def walk_tree(path: str, prefix: str = "", depth: int = 0):
         """Recursively walk directory tree."""
         if depth > max_depth:
             return
 
+        # scandir entries cache their type, so sorting and the checks
+        # below don't stat every entry again
         try:
-            entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
+            with os.scandir(path) as it:
+                # Filter out hidden files for cleaner display
+                entries = [e for e in it if not e.name.startswith('.')]
+            entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
         except PermissionError:
-            print(f"{prefix}{TEE}[Permission Denied]")
+            lines.append(f"{prefix}{TEE}[Permission Denied]")
             return
         except OSError as e:
-            print(f"{prefix}{TEE}[Error: {e}]")
+            lines.append(f"{prefix}{TEE}[Error: {e}]")
             return
 
-        # Filter out hidden files for cleaner display
-        entries = [e for e in entries if not e.name.startswith('.')]
-
         for i, entry in enumerate(entries):
             is_last = (i == len(entries) - 1)
 
-            # Print entry
-            print(format_entry(entry, is_last, prefix, depth))
+            lines.append(format_entry(entry, is_last, prefix, depth))
 
             # Recurse into directories
             if entry.is_dir() and depth < max_depth:
                 extension = BLANK if is_last else PIPE
-                walk_tree(entry, prefix + extension, depth + 1)
+                walk_tree(entry.path, prefix + extension, depth + 1)
 
     # Display root
-    print(f"\n{root}/")
+    lines.append(f"\n{root}/")
 
     # Walk tree
-    walk_tree(root, "", 0)
+    walk_tree(root_path, "", 0)
 
     # Display summary
     if show_sizes and (file_count > 0 or dir_count > 0):
-        print(f"\nTotal: {format_size(total_size)} across {file_count} files in {dir_count} directories")
-    print()
\ No newline at end of file
+        lines.append(f"\nTotal: {format_size(total_size)} across {file_count} files in {dir_count} directories")
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
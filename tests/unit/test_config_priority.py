@@ -236,6 +236,24 @@ class TestConfigCache(unittest.TestCase):
         result2 = self.cache.get_env_file('.env')
         self.assertEqual(result2['KEY'], 'value2')
 
+    def test_cache_detects_file_changes_before_ttl(self):
+        """Test that an edited file is re-read without waiting for TTL"""
+        cache = ConfigCache(ttl_seconds=300)
+        with open('.env', 'w') as f:
+            f.write('KEY=value1\n')
+
+        result1 = cache.get_env_file('.env')
+        self.assertEqual(result1['KEY'], 'value1')
+
+        # Update file with a different size and an explicit newer mtime
+        with open('.env', 'w') as f:
+            f.write('KEY=updated\n')
+        stat = os.stat('.env')
+        os.utime('.env', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result2 = cache.get_env_file('.env')
+        self.assertEqual(result2['KEY'], 'updated')
+
     def test_cache_thread_safety(self):
         """Test that cache is thread-safe"""
         with open('.env', 'w') as f:
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for FileLock
+Tests that tools sharing a lock prefix exclude each other
+"""
+
+import errno
+import io
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import core
+from lib.core import FileLock
+
+
+class TestFileLock(unittest.TestCase):
+    """Test lock acquisition and release"""
+
+    def setUp(self):
+        """Set up a unique lock prefix for each test"""
+        self.prefix = f"media_library_tools_test_{uuid.uuid4().hex}"
+        self.lock_path = os.path.join(tempfile.gettempdir(), f"{self.prefix}.lock")
+        self.locks = []
+
+    def tearDown(self):
+        """Release locks and remove the lock file"""
+        for lock in self.locks:
+            lock.release_lock()
+        if os.path.exists(self.lock_path):
+            os.unlink(self.lock_path)
+
+    def _make_lock(self):
+        lock = FileLock(self.prefix)
+        self.locks.append(lock)
+        return lock
+
+    def test_second_instance_is_rejected(self):
+        """Test that a held lock blocks another instance"""
+        first = self._make_lock()
+        second = self._make_lock()
+
+        self.assertTrue(first.acquire_lock())
+        self.assertFalse(second.acquire_lock())
+
+    def test_lock_can_be_reacquired_after_release(self):
+        """Test that releasing the lock lets another instance acquire it"""
+        first = self._make_lock()
+        second = self._make_lock()
+
+        self.assertTrue(first.acquire_lock())
+        first.release_lock()
+        self.assertTrue(second.acquire_lock())
+
+    def test_lock_file_records_pid(self):
+        """Test that the lock file contains the owning process id"""
+        lock = self._make_lock()
+        self.assertTrue(lock.acquire_lock())
+
+        with open(self.lock_path) as f:
+            self.assertEqual(f.read(), str(os.getpid()))
+
+    @unittest.skipUnless(os.path.isdir("/proc/self/fd"), "requires /proc/self/fd")
+    def test_failed_acquire_does_not_leak_descriptors(self):
+        """Test that repeated failed acquires close their file descriptors"""
+        first = self._make_lock()
+        second = self._make_lock()
+        self.assertTrue(first.acquire_lock())
+
+        open_fds = len(os.listdir("/proc/self/fd"))
+        with redirect_stdout(io.StringIO()):
+            for _ in range(20):
+                self.assertFalse(second.acquire_lock())
+        self.assertEqual(len(os.listdir("/proc/self/fd")), open_fds)
+
+    def test_contention_reported_as_running_instance(self):
+        """Test that a held lock is reported as another running instance"""
+        first = self._make_lock()
+        second = self._make_lock()
+        self.assertTrue(first.acquire_lock())
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertFalse(second.acquire_lock())
+        self.assertIn("Another instance is already running", output.getvalue())
+
+    def test_other_lock_errors_reported(self):
+        """Test that errors other than contention report the real cause"""
+        lock = self._make_lock()
+        lock._lock_path = os.path.join(tempfile.gettempdir(), uuid.uuid4().hex, "missing.lock")
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertFalse(lock.acquire_lock())
+        self.assertNotIn("Another instance", output.getvalue())
+        self.assertIn("Could not lock", output.getvalue())
+
+    @unittest.skipIf(core.fcntl is None, "requires fcntl")
+    def test_lock_call_failure_not_reported_as_contention(self):
+        """Test that a failing lock call other than EWOULDBLOCK is reported as is"""
+        lock = self._make_lock()
+
+        output = io.StringIO()
+        with patch.object(core.fcntl, "flock", side_effect=OSError(errno.ENOLCK, "No locks available")), \
+                redirect_stdout(output):
+            self.assertFalse(lock.acquire_lock())
+        self.assertNotIn("Another instance", output.getvalue())
+        self.assertIn("No locks available", output.getvalue())
+
+    def test_force_skips_locking(self):
+        """Test that force bypasses a held lock"""
+        first = self._make_lock()
+        second = self._make_lock()
+
+        self.assertTrue(first.acquire_lock())
+        self.assertTrue(second.acquire_lock(force=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
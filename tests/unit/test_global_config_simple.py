@@ -67,61 +67,18 @@ class TestGlobalConfigSimple(unittest.TestCase):
             self.fail(f"Script file does not exist: {script_path}")
 
         try:
-            # Read the script and extract the function
-            namespace = {"__file__": str(script_path)}
-
-            # Add necessary imports that the script might need
-            # Handle fcntl import with Windows compatibility
-            try:
-                import fcntl
-            except ImportError:
-                fcntl = None  # Windows compatibility
-
-            namespace.update(
-                {
-                    "os": os,
-                    "sys": sys,
-                    "Path": Path,
-                    "argparse": __import__("argparse"),
-                    "shutil": __import__("shutil"),
-                    "tempfile": __import__("tempfile"),
-                    "fcntl": fcntl,
-                    "re": __import__("re"),
-                }
-            )
+            # Execute the script as a module (without running main()) so the
+            # function can reach the module-level state it depends on, such as
+            # the shared .env cache
+            namespace = {"__file__": str(script_path), "__name__": "plex_correct_dirs"}
 
             with open(script_path, encoding="utf-8") as f:
                 script_content = f.read()
 
-            # Find just the function definition
-            lines = script_content.split("\n")
-            func_start = None
-            func_end = None
-
-            for i, line in enumerate(lines):
-                if line.startswith("def read_global_config_bool("):
-                    func_start = i
-                elif (
-                    func_start is not None
-                    and line
-                    and not line.startswith(" ")
-                    and not line.startswith("\t")
-                ):
-                    func_end = i
-                    break
-
-            if func_start is None:
-                self.fail("Function read_global_config_bool not found")
-
-            if func_end is None:
-                func_end = len(lines)
-
-            # Extract function code
-            func_lines = lines[func_start:func_end]
-            func_code = "\n".join(func_lines)
-
-            # Execute just the function definition
-            exec(func_code, namespace)
+            # The global .env path is resolved at import, so load under the
+            # same home directory the tests use
+            with patch("pathlib.Path.home", return_value=self.home_dir):
+                exec(compile(script_content, str(script_path), "exec"), namespace)
 
             if "read_global_config_bool" not in namespace:
                 self.fail("Function read_global_config_bool not loaded properly")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Unit tests for shared media name utilities module (lib/media_name_utils.py)
+
+Tests year extraction and show name cleaning.
+"""
+
+import unittest
+import importlib.util
+from pathlib import Path
+
+
+def load_module_from_path(module_path: str, module_name: str):
+    """Load a Python module from a file path."""
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMediaNameParser(unittest.TestCase):
+    """Test MediaNameParser class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Load media_name_utils module."""
+        module_path = Path(__file__).parent.parent.parent / 'lib' / 'media_name_utils.py'
+        cls.module = load_module_from_path(str(module_path), 'media_name_utils')
+
+    def setUp(self):
+        self.parser = self.module.MediaNameParser()
+
+    def test_extract_year_priority(self):
+        """Test that parentheses years win over bare years."""
+        self.assertEqual(self.parser.extract_year("Blade Runner 2049 (2017)"), 2017)
+        self.assertEqual(self.parser.extract_year("The Wire [2002]"), 2002)
+        self.assertIsNone(self.parser.extract_year("Show Name"))
+
+    def test_clean_show_name(self):
+        """Test documented cleaning examples."""
+        self.assertEqual(self.parser.clean_show_name("Breaking Bad (2008)"), "Breaking Bad")
+        self.assertEqual(self.parser.clean_show_name("Show Name - 2010 - Season 1"),
+                         "Show Name -- Season 1")
+        self.assertEqual(self.parser.clean_show_name("Show Name"), "Show Name")
+
+    def test_clean_show_name_removes_patterns_in_order(self):
+        """Test that year patterns are removed one after another, in order."""
+        # Removing "(2008)" leaves "1850" glued to "Season", which no later
+        # pattern matches, so it stays
+        self.assertEqual(self.parser.clean_show_name("1850(2008)Season 1_Name"),
+                         "1850Season 1_Name")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests for shared retry utilities module (lib/retry_utils.py)
+
+Tests the backoff delays of each jitter mode with sleep and randomness
+patched out.
+"""
+
+import random
+import unittest
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+
+def load_module_from_path(module_path: str, module_name: str):
+    """Load a Python module from a file path."""
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestRetryWithBackoff(unittest.TestCase):
+    """Test retry_with_backoff jitter modes."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Load retry_utils module."""
+        module_path = Path(__file__).parent.parent.parent / 'lib' / 'retry_utils.py'
+        cls.module = load_module_from_path(str(module_path), 'retry_utils')
+
+    def delays(self, random_values, max_retries=4, **options):
+        """Run a call that always fails and return the delays slept between attempts."""
+        @self.module.retry_with_backoff(max_retries=max_retries, **options)
+        def always_fails():
+            raise ConnectionResetError()
+
+        with patch('time.sleep') as sleep, \
+                patch('random.random', side_effect=random_values):
+            with self.assertRaises(ConnectionResetError):
+                always_fails()
+        return [call.args[0] for call in sleep.call_args_list]
+
+    def assertDelays(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for actual_delay, expected_delay in zip(actual, expected):
+            self.assertAlmostEqual(actual_delay, expected_delay)
+
+    def test_decorrelated_is_default(self):
+        """Test that each delay is drawn up to 3x the previous one."""
+        self.assertDelays(self.delays([0.5] * 4), [2.0, 3.5, 5.75, 9.125])
+
+    def test_decorrelated_bounds(self):
+        """Test that decorrelated delays stay between base_delay and max_delay."""
+        self.assertDelays(self.delays([0.0] * 4, base_delay=2.0), [2.0] * 4)
+        self.assertDelays(self.delays([1.0] * 4, base_delay=2.0, max_delay=30.0),
+                          [6.0, 18.0, 30.0, 30.0])
+
+        rng = random.Random(1234)
+        values = [rng.random() for _ in range(50)]
+        for delay in self.delays(values, max_retries=50, base_delay=0.5, max_delay=10.0):
+            self.assertGreaterEqual(delay, 0.5)
+            self.assertLessEqual(delay, 10.0)
+
+    def test_full_jitter(self):
+        """Test that full jitter scales the exponential delay."""
+        self.assertDelays(self.delays([0.5] * 4, jitter='full'), [0.5, 1.0, 2.0, 4.0])
+
+    def test_no_jitter(self):
+        """Test plain exponential delays, capped at max_delay."""
+        self.assertDelays(self.delays([], jitter='none', max_delay=5.0), [1.0, 2.0, 4.0, 5.0])
+
+    def test_legacy_jitter(self):
+        """Test that the original exponential delay plus padding is still available."""
+        self.assertDelays(self.delays([0.5] * 4, jitter='legacy'), [1.3, 2.3, 4.3, 8.3])
+
+    def test_unknown_jitter_mode(self):
+        """Test that an unknown jitter mode is rejected when decorating."""
+        with self.assertRaises(ValueError):
+            self.module.retry_with_backoff(jitter='exponential')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -81,6 +81,13 @@ class TestSeasonValidationEngine(unittest.TestCase):
         self.assertFalse(self.validator.detect_quality_indicators("Show.S01E01.mkv"))
         self.assertFalse(self.validator.detect_quality_indicators("Show.Season.01.Episode.01.mkv"))
 
+    def test_quality_patterns_list_override(self):
+        """Test that QUALITY_PATTERNS can be overridden with a list."""
+        validator = self.module.SeasonValidationEngine()
+        validator.QUALITY_PATTERNS = [r'\bWEBRip\b']
+        self.assertTrue(validator.detect_quality_indicators("Show.S01E01.WEBRip.mkv"))
+        self.assertFalse(validator.detect_quality_indicators("Show.S01E01.720p.mkv"))
+
     def test_position_validation(self):
         """Test position-based validation."""
         filename = "Show.S01E01.Episode.Name.mkv"
@@ -216,6 +223,22 @@ class TestBaseSeasonDetector(unittest.TestCase):
         self.assertIsNone(season)
         self.assertEqual(desc, "No pattern matched")
 
+    def test_validator_changes_apply_to_repeated_names(self):
+        """Test that cached matches are revalidated by the current validator."""
+        detector = self.module.BaseSeasonDetector()
+        filename = "Show - 05 - Title.mkv"
+        season, _, _ = detector.extract_season_info(filename)
+        self.assertEqual(season, 5)
+
+        detector.validator.QUALITY_PATTERNS = ('Title',)
+        season, desc, _ = detector.extract_season_info(filename)
+        self.assertIsNone(season)
+        self.assertEqual(desc, "No pattern matched")
+
+        # Other detectors share the cached matches but not the change
+        season, _, _ = self.detector.extract_season_info(filename)
+        self.assertEqual(season, 5)
+
     def test_case_insensitivity(self):
         """Test that patterns are case-insensitive."""
         season1, _, _ = self.detector.extract_season_info("Show.S01E01.mkv")
@@ -106,6 +106,12 @@ class TestUIFunctions(unittest.TestCase):
         """Test format_size with zero value"""
         self.assertEqual(self.ui.format_size(0), "0B")
 
+    def test_format_size_non_int_bytes(self):
+        """Test format_size formats bools and floats below 1K as numbers"""
+        self.assertEqual(self.ui.format_size(True), "1B")
+        self.assertEqual(self.ui.format_size(False), "0B")
+        self.assertEqual(self.ui.format_size(512.4), "512B")
+
     # Test format_status_message function
     def test_format_status_message_with_emoji(self):
         """Test format_status_message with emoji support"""
@@ -142,6 +148,29 @@ class TestUIFunctions(unittest.TestCase):
         # Restore original function
         self.ui.should_use_emojis = original_should_use_emojis
 
+    def test_clear_ui_cache_forces_redetection(self):
+        """Test that clear_ui_cache resets memoized emoji detection"""
+        calls = []
+
+        @self.ui.lru_cache(maxsize=1)
+        def detect():
+            calls.append(1)
+            return True
+
+        original_should_use_emojis = self.ui.should_use_emojis
+        self.ui.should_use_emojis = detect
+
+        self.ui.format_status_message("First", "✅", "SUCCESS")
+        self.ui.format_status_message("Second", "✅", "SUCCESS")
+        self.assertEqual(len(calls), 1)
+
+        self.ui.clear_ui_cache()
+        self.ui.format_status_message("Third", "✅", "SUCCESS")
+        self.assertEqual(len(calls), 2)
+
+        # Restore original function
+        self.ui.should_use_emojis = original_should_use_emojis
+
     # Test display_item_list function
     def test_display_item_list_basic(self):
         """Test display_item_list with basic list"""
@@ -398,6 +427,36 @@ class TestUIFunctions(unittest.TestCase):
         self.assertIn("OK", full_output)
         self.assertIn("Error", full_output)
 
+    # Test BufferedOutput context manager
+    def test_buffered_output_holds_output_until_exit(self):
+        """Test that output is written to the real stream when the block exits"""
+        with self.ui.BufferedOutput():
+            self.ui.display_progress_item(1, 2, "file1.mp4")
+            self.ui.display_progress_item(2, 2, "file2.mkv")
+            self.assertEqual(self.captured_output.getvalue(), "")
+
+        output = self.get_output()
+        self.assertEqual(output, "[1/2] Processing: file1.mp4\n[2/2] Processing: file2.mkv\n")
+        self.assertIs(sys.stdout, self.captured_output)
+
+    def test_buffered_output_writes_early_at_min_size(self):
+        """Test that a full buffer is written before the block exits"""
+        with self.ui.BufferedOutput(min_size=10):
+            sys.stdout.write("short\n")
+            self.assertEqual(self.captured_output.getvalue(), "")
+            sys.stdout.write("longer line\n")
+            self.assertEqual(self.captured_output.getvalue(), "short\nlonger line\n")
+
+    def test_buffered_output_restores_stdout_on_error(self):
+        """Test that stdout is restored and buffered output kept on exceptions"""
+        with self.assertRaises(ValueError):
+            with self.ui.BufferedOutput():
+                print("before error")
+                raise ValueError("boom")
+
+        self.assertIs(sys.stdout, self.captured_output)
+        self.assertEqual(self.get_output(), "before error\n")
+
 
 class TestUIFunctionsIntegration(unittest.TestCase):
     """Integration tests for UI functions with modular imports"""
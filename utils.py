@@ -136,6 +136,30 @@ except ImportError as e:
         term = os.environ.get("TERM", "")
         return bool(not term or term == "dumb")
 
+    _TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+    def _lookup_in_env_file(path, var_name: str) -> Optional[str]:
+        """
+        Find the value of a variable in a .env file.
+
+        Args:
+            path: Path to the .env file
+            var_name: Name of the variable to look up
+
+        Returns:
+            The stripped value, or None if the file or variable is missing
+        """
+        prefix = f"{var_name}="
+        try:
+            with open(path) as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith(prefix):
+                        return line[len(prefix) :].strip()
+        except OSError:
+            pass
+        return None
+
     def read_global_config_bool(var_name: str, default: bool = False) -> bool:
         """
         Read a boolean environment variable with support for .env files.
@@ -150,33 +174,13 @@ except ImportError as e:
         # Check environment variable directly
         value = os.environ.get(var_name)
         if value is not None:
-            return value.lower() in ("true", "1", "yes", "on")
+            return value.lower() in _TRUE_VALUES
 
-        # Check local .env file
-        env_file = ".env"
-        if os.path.exists(env_file):
-            try:
-                with open(env_file) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith(f"{var_name}="):
-                            value = line.split("=", 1)[1].strip()
-                            return value.lower() in ("true", "1", "yes", "on")
-            except OSError:
-                pass
-
-        # Check global .env file
-        global_env_path = Path.home() / ".media-library-tools" / ".env"
-        if global_env_path.exists():
-            try:
-                with open(global_env_path) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith(f"{var_name}="):
-                            value = line.split("=", 1)[1].strip()
-                            return value.lower() in ("true", "1", "yes", "on")
-            except OSError:
-                pass
+        # Check local .env file, then global .env file
+        for env_file in (".env", Path.home() / ".media-library-tools" / ".env"):
+            value = _lookup_in_env_file(env_file, var_name)
+            if value is not None:
+                return value.lower() in _TRUE_VALUES
 
         return default
 